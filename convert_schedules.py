@@ -7,20 +7,31 @@ the Go web player can easily parse.
 
 import os
 import sys
-import json
 import pickle
 import datetime
 from pathlib import Path
 
+import orjson
+
 # Add the current directory to Python path to import fs42 modules
 sys.path.append(os.getcwd())
 
 from fs42.station_manager import StationManager
 from fs42.liquid_manager import LiquidManager
 
+# older pickled catalog entries can be missing some of these, so each has a default
+CATALOG_ENTRY_DEFAULTS = (("title", ""), ("duration", 0), ("tag", ""), ("count", 0), ("hints", []))
+
+
+def catalog_entry_fields(entry):
+    entry_data = {"path": entry.path}
+    for key, default in CATALOG_ENTRY_DEFAULTS:
+        entry_data[key] = getattr(entry, key, default)
+    return entry_data
+
 
 def datetime_to_json(obj):
-    """Convert datetime objects to JSON-serializable format."""
+    """Convert datetime objects to the tagged format the Go web player parses."""
     if isinstance(obj, datetime.datetime):
         return {
             "__type__": "datetime",
@@ -39,14 +50,30 @@ def datetime_to_json(obj):
     return obj
 
 
+def json_default(obj):
+    """Fallback for orjson - it handles datetime/date natively, so only timedelta reaches here."""
+    if isinstance(obj, datetime.timedelta):
+        # same tagged form as datetime_to_json, the Go reader expects it
+        return datetime_to_json(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(data, option=None):
+    return orjson.dumps(data, default=json_default, option=option)
+
+
+def write_json(data, output_path):
+    with open(output_path, 'wb') as f:
+        f.write(dump_json(data, option=orjson.OPT_INDENT_2))
+
+
 def convert_schedule_to_json(network_name, schedule_path, output_path):
     """Convert a single schedule file from pickle to JSON."""
     print(f"Converting schedule for {network_name} from {schedule_path}")
     
     try:
-        # Load the pickle schedule
-        with open(schedule_path, 'rb') as f:
-            schedule_blocks = pickle.load(f)
+        # Load the pickle schedule - read it in one go so the unpickler works from memory
+        schedule_blocks = pickle.loads(Path(schedule_path).read_bytes())
         
         # Convert schedule blocks to JSON-serializable format
         json_schedule = []
@@ -55,24 +82,21 @@ def convert_schedule_to_json(network_name, schedule_path, output_path):
                 "start_time": datetime_to_json(block.start_time),
                 "end_time": datetime_to_json(block.end_time),
                 "title": block.title,
-                "plan": []
+                # Convert plan entries - older pickles predate is_stream, so read it from the instance dict
+                "plan": [
+                    {
+                        "path": entry.path,
+                        "duration": int(entry.duration),  # Convert to int for Go compatibility
+                        "skip": entry.skip,
+                        "is_stream": entry.__dict__.get("is_stream", False),
+                    }
+                    for entry in block.plan
+                ],
             }
-            
-            # Convert plan entries
-            for entry in block.plan:
-                entry_data = {
-                    "path": entry.path,
-                    "duration": int(entry.duration),  # Convert to int for Go compatibility
-                    "skip": entry.skip,
-                    "is_stream": getattr(entry, 'is_stream', False)
-                }
-                block_data["plan"].append(entry_data)
-            
             json_schedule.append(block_data)
         
         # Write JSON file
-        with open(output_path, 'w') as f:
-            json.dump(json_schedule, f, indent=2, default=datetime_to_json)
+        write_json(json_schedule, output_path)
         
         print(f"Successfully converted {len(json_schedule)} blocks to {output_path}")
         return True
@@ -88,49 +112,39 @@ def convert_catalog_to_json(network_name, catalog_path, output_path):
     
     try:
         # Load the pickle catalog
-        with open(catalog_path, 'rb') as f:
-            catalog_data = pickle.load(f)
-        
-        # Convert catalog to JSON-serializable format
-        json_catalog = {
-            "version": catalog_data.get("version", 0.1),
-            "clip_index": {},
-            "sequences": {}
-        }
+        catalog_data = pickle.loads(Path(catalog_path).read_bytes())
         
-        # Convert clip_index
-        for tag, entries in catalog_data.get("clip_index", {}).items():
-            if isinstance(entries, list):
-                json_entries = []
-                for entry in entries:
-                    if hasattr(entry, 'path'):
-                        entry_data = {
-                            "path": entry.path,
-                            "title": getattr(entry, 'title', ''),
-                            "duration": int(getattr(entry, 'duration', 0)),  # Convert to int for Go compatibility
-                            "tag": getattr(entry, 'tag', ''),
-                            "count": getattr(entry, 'count', 0),
-                            "hints": getattr(entry, 'hints', [])
-                        }
-                        json_entries.append(entry_data)
-                json_catalog["clip_index"][tag] = json_entries
-            else:
-                json_catalog["clip_index"][tag] = entries
-        
-        # Convert sequences
-        for seq_key, sequence in catalog_data.get("sequences", {}).items():
-            if hasattr(sequence, 'episodes'):
-                seq_data = {
-                    "episodes": [ep.fpath for ep in sequence.episodes],
-                    "current_index": getattr(sequence, 'current_index', 0)
-                }
-                json_catalog["sequences"][seq_key] = seq_data
-            else:
-                json_catalog["sequences"][seq_key] = str(sequence)
-        
-        # Write JSON file
-        with open(output_path, 'w') as f:
-            json.dump(json_catalog, f, indent=2, default=datetime_to_json)
+        # Stream the catalog out one tag at a time so only a single tag's converted entries are held in memory
+        with open(output_path, 'wb') as f:
+            f.write(b'{"version":' + dump_json(catalog_data.get("version", 0.1)) + b',"clip_index":{')
+
+            # Convert clip_index
+            for i, (tag, entries) in enumerate(catalog_data.get("clip_index", {}).items()):
+                if isinstance(entries, list):
+                    json_entries = []
+                    for entry in entries:
+                        if hasattr(entry, 'path'):
+                            entry_data = catalog_entry_fields(entry)
+                            # Convert to int for Go compatibility
+                            entry_data["duration"] = int(entry_data["duration"])
+                            json_entries.append(entry_data)
+                    entries = json_entries
+                if i:
+                    f.write(b",")
+                f.write(dump_json(tag) + b":" + dump_json(entries))
+
+            # Convert sequences
+            json_sequences = {}
+            for seq_key, sequence in catalog_data.get("sequences", {}).items():
+                if hasattr(sequence, 'episodes'):
+                    json_sequences[seq_key] = {
+                        "episodes": [ep.fpath for ep in sequence.episodes],
+                        "current_index": getattr(sequence, 'current_index', 0)
+                    }
+                else:
+                    json_sequences[seq_key] = str(sequence)
+
+            f.write(b'},"sequences":' + dump_json(json_sequences) + b"}")
         
         print(f"Successfully converted catalog to {output_path}")
         return True
@@ -140,6 +154,27 @@ def convert_catalog_to_json(network_name, catalog_path, output_path):
         return False
 
 
+def list_dir(dir_path):
+    try:
+        return set(os.listdir(dir_path))
+    except FileNotFoundError:
+        return set()
+
+
+def find_by_pattern(dir_path, dir_files, network_name, suffix):
+    """Find a station's pickle file using the common naming patterns."""
+    candidates = [
+        f"{network_name}.bin",
+        f"{network_name}_{suffix}.bin",
+        f"{network_name.lower()}.bin",
+        f"{network_name.lower()}_{suffix}.bin"
+    ]
+    for name in candidates:
+        if name in dir_files:
+            return f"{dir_path}/{name}"
+    return None
+
+
 def main():
     """Convert all schedule and catalog files to JSON."""
     print("Converting FieldStation42 pickle files to JSON...")
@@ -152,6 +187,10 @@ def main():
     station_manager = StationManager()
     success_count = 0
     total_count = 0
+
+    # list the directories once rather than probing each candidate name per station
+    runtime_files = list_dir("runtime")
+    catalog_files = list_dir("catalog")
     
     for station in station_manager.stations:
         network_name = station["network_name"]
@@ -163,17 +202,9 @@ def main():
         schedule_path = station.get("schedule_path")
         if not schedule_path:
             # Try common schedule path patterns
-            possible_paths = [
-                f"runtime/{network_name}.bin",
-                f"runtime/{network_name}_schedule.bin",
-                f"runtime/{network_name.lower()}.bin",
-                f"runtime/{network_name.lower()}_schedule.bin"
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    schedule_path = path
-                    print(f"Found schedule at: {schedule_path}")
-                    break
+            schedule_path = find_by_pattern("runtime", runtime_files, network_name, "schedule")
+            if schedule_path:
+                print(f"Found schedule at: {schedule_path}")
         
         if schedule_path and os.path.exists(schedule_path):
             json_schedule_path = json_dir / f"{network_name}_schedule.json"
@@ -186,17 +217,9 @@ def main():
         catalog_path = station.get("catalog_path")
         if not catalog_path:
             # Try common catalog path patterns
-            possible_paths = [
-                f"catalog/{network_name}.bin",
-                f"catalog/{network_name}_catalog.bin",
-                f"catalog/{network_name.lower()}.bin",
-                f"catalog/{network_name.lower()}_catalog.bin"
-            ]
-            for path in possible_paths:
-                if os.path.exists(path):
-                    catalog_path = path
-                    print(f"Found catalog at: {catalog_path}")
-                    break
+            catalog_path = find_by_pattern("catalog", catalog_files, network_name, "catalog")
+            if catalog_path:
+                print(f"Found catalog at: {catalog_path}")
         
         if catalog_path and os.path.exists(catalog_path):
             json_catalog_path = json_dir / f"{network_name}_catalog.json"
@@ -26,6 +26,7 @@ let
       ))
       pyserial
       python-mpv-jsonipc
+      orjson
       (disableTests textual)
 
       # Development tools
@@ -1,29 +1,36 @@
 import argparse
 import time
 import datetime
-import json
 import signal
 import logging
 
+import orjson
+
 from fs42.station_manager import StationManager
 from fs42.timings import MIN_1, DAYS
 from fs42.station_player import (
     StationPlayer,
     PlayStatus,
     check_channel_socket,
-    update_status_socket,
+    status_writer,
 )
 from fs42.reception import ReceptionStatus
+from fs42.tick_timer import TickTimer
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)s:%(name)s:%(message)s", level=logging.INFO
 )
 
 debounce_fragment = 0.1
+# how long to rest between retries of a channel that failed to play
+failed_backoff_min = 1.0
+failed_backoff_max = 30.0
 
 
 def main_loop(transition_fn):
     manager = StationManager()
+    stations = manager.stations
+    n_stations = len(stations)
     reception = ReceptionStatus()
     logger = logging.getLogger("MainLoop")
     logger.info("Starting main loop")
@@ -35,7 +42,7 @@ def main_loop(transition_fn):
         pass
 
     channel_index = 0
-    if not len(manager.stations):
+    if not n_stations:
         logger.error(
             "Could not find any station runtimes - do you have your channels configured?"
         )
@@ -47,7 +54,7 @@ def main_loop(transition_fn):
         )
         return
 
-    player = StationPlayer(manager.stations[channel_index])
+    player = StationPlayer(stations[channel_index])
     reception.degrade()
     player.update_filters()
 
@@ -55,68 +62,78 @@ def main_loop(transition_fn):
         logger.critical("Received sig-int signal, attempting to exit gracefully...")
         player.shutdown()
 
-        update_status_socket("stopped", "", -1)
+        # queued behind anything still pending, close waits for it to be written
+        status_writer().post("stopped", "", -1)
+        status_writer().close()
         logger.info("Shutdown completed as expected - exiting application")
         exit(0)
 
     signal.signal(signal.SIGINT, sigint_handler)
 
-    channel_conf = manager.stations[channel_index]
+    channel_conf = stations[channel_index]
+    # these only change with the channel, so look them up once per tune
+    net_type = channel_conf["network_type"]
+    net_name = channel_conf["network_name"]
+    chan_num = channel_conf["channel_number"]
+    standby = channel_conf.get("standby_image")
 
     # this is actually the main loop
     outcome = None
     skip_play = False
     stuck_timer = 0
+    backoff = failed_backoff_min
 
     while True:
-        logger.info(f"Playing station: {channel_conf['network_name']}")
+        logger.info("Playing station: %s", net_name)
 
-        if channel_conf["network_type"] == "guide" and not skip_play:
+        if net_type == "guide" and not skip_play:
             logger.info("Starting the guide channel")
             outcome = player.show_guide(channel_conf)
         elif not skip_play:
             now = datetime.datetime.now()
 
-            week_day = DAYS[now.weekday()]
-            hour = now.hour
-            skip = now.minute * MIN_1 + now.second
-
-            logger.info(
-                f"Starting station {channel_conf['network_name']} at: {week_day} {hour} skipping={skip} "
-            )
+            # the day/hour/skip are only worked out for the log line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Starting station {net_name} at: {DAYS[now.weekday()]} {now.hour} "
+                    f"skipping={now.minute * MIN_1 + now.second} "
+                )
 
 
             outcome = player.play_slot(
-                channel_conf["network_name"], datetime.datetime.now()
+                net_name, now
             )
 
 
 
-        logger.debug(f"Got player outcome:{outcome.status}")
+        logger.debug("Got player outcome:%s", outcome.status)
 
         # reset skip
         skip_play = False
 
         if outcome.status == PlayStatus.CHANNEL_CHANGE:
             stuck_timer = 0
-            tune_up = True
+            backoff = failed_backoff_min
+            # up unless the payload says otherwise, a direct tune moves to its channel and then stays put
+            delta = 1
             # get the json payload
             if outcome.payload:
                 try:
-                    as_obj = json.loads(outcome.payload)
+                    as_obj = orjson.loads(outcome.payload)
                     if "command" in as_obj:
                         if as_obj["command"] == "direct":
-                            tune_up = False
+                            delta = 0
                             if "channel" in as_obj:
                                 logger.debug(
-                                    f"Got direct tune command for channel {as_obj['channel']}"
+                                    "Got direct tune command for channel %s", as_obj["channel"]
                                 )
                                 new_index = manager.index_from_channel(
                                     as_obj["channel"]
                                 )
                                 if new_index is None:
                                     logger.warning(
-                                        f"Got direct tune command but could not find station with channel {as_obj['channel']}"
+                                        "Got direct tune command but could not find station with channel %s",
+                                        as_obj["channel"],
                                     )
                                 else:
                                     channel_index = new_index
@@ -125,28 +142,27 @@ def main_loop(transition_fn):
                                     "Got direct tune command, but no channel specified"
                                 )
                         elif as_obj["command"] == "up":
-                            tune_up = True
+                            delta = 1
                             logger.debug("Got channel up command")
                         elif as_obj["command"] == "down":
-                            tune_up = False
+                            delta = -1
                             logger.debug("Got channel down command")
-                            channel_index -= 1
-                            if channel_index < 0:
-                                channel_index = len(manager.stations) - 1
 
-                except Exception as e:
-                    logger.exception(e)
+                # orjson's decode error is a ValueError, TypeError covers valid json that isn't an object
+                except (ValueError, TypeError) as e:
                     logger.warning(
-                        "Got payload on channel change, but JSON convert failed"
+                        "Got payload on channel change, but JSON convert failed: %s", e
                     )
 
-            if tune_up:
+            if delta:
                 logger.info("Starting channel change")
-                channel_index += 1
-                if channel_index >= len(manager.stations):
-                    channel_index = 0
+                channel_index = (channel_index + delta) % n_stations
 
-            channel_conf = manager.stations[channel_index]
+            channel_conf = stations[channel_index]
+            net_type = channel_conf["network_type"]
+            net_name = channel_conf["network_name"]
+            chan_num = channel_conf["channel_number"]
+            standby = channel_conf.get("standby_image")
             player.station_config = channel_conf
 
             # long_change_effect(player, reception)
@@ -156,23 +172,28 @@ def main_loop(transition_fn):
             stuck_timer += 1
 
             # only put it up once after 2 seconds of being stuck
-            if stuck_timer >= 2 and "standby_image" in channel_conf:
-                player.play_file(channel_conf["standby_image"])
+            if stuck_timer >= 2 and standby:
+                player.play_file(standby)
             current_title_on_stuck = player.get_current_title()
-            update_status_socket(
+            status_writer().post(
                 "stuck",
-                channel_conf["network_name"],
-                channel_conf["channel_number"],
+                net_name,
+                chan_num,
                 current_title_on_stuck,
             )
 
-            time.sleep(1)
             logger.critical(
-                "Player failed to start - resting for 1 second and trying again"
+                "Player failed to start - resting for %.1f seconds and trying again", backoff
             )
 
-            # check for channel change so it doesn't stay stuck on a broken channel
-            new_outcome = check_channel_socket()
+            # rest, but wake as soon as the channel socket is written so it doesn't stay stuck on a broken channel
+            new_outcome = None
+            rest_until = time.monotonic() + backoff
+            while new_outcome is None and (remaining := rest_until - time.monotonic()) > 0:
+                if player.channel_watcher.wait(remaining):
+                    new_outcome = check_channel_socket()
+            # a channel that keeps failing is retried less and less often
+            backoff = min(backoff * 1.5, failed_backoff_max)
             if new_outcome is not None:
                 outcome = new_outcome
                 # set skip play so outcome isn't overwritten
@@ -180,6 +201,7 @@ def main_loop(transition_fn):
                 skip_play = True
         elif outcome.status == PlayStatus.SUCCESS:
             stuck_timer = 0
+            backoff = failed_backoff_min
         else:
             stuck_timer = 0
 
@@ -192,32 +214,34 @@ def short_change_effect(player, reception):
     prev = reception.improve_amount
     reception.improve_amount = 0
 
-    while not reception.is_degraded():
-        reception.degrade(0.2)
-        player.update_filters()
-        time.sleep(debounce_fragment)
+    with TickTimer(debounce_fragment) as timer:
+        for chaos, vf in reception.degrade_steps(0.2):
+            reception.chaos = chaos
+            player.set_filter(vf)
+            timer.tick()
 
     reception.improve_amount = prev
 
 
 def long_change_effect(player, reception):
-    # add noise to current channel
-    while not reception.is_degraded():
-        reception.degrade()
-        player.update_filters()
-        time.sleep(debounce_fragment)
-
-    # reception.improve(1)
-    player.play_file("runtime/static.mp4")
-    while not reception.is_perfect():
-        reception.improve()
-        player.update_filters()
-        time.sleep(debounce_fragment)
-    # time.sleep(1)
-    while not reception.is_degraded():
-        reception.degrade()
-        player.update_filters()
-        time.sleep(debounce_fragment)
+    with TickTimer(debounce_fragment) as timer:
+        # add noise to current channel
+        for chaos, vf in reception.degrade_steps():
+            reception.chaos = chaos
+            player.set_filter(vf)
+            timer.tick()
+
+        # reception.improve(1)
+        player.play_file("runtime/static.mp4")
+        for chaos, vf in reception.improve_steps():
+            reception.chaos = chaos
+            player.set_filter(vf)
+            timer.tick()
+        # time.sleep(1)
+        for chaos, vf in reception.degrade_steps():
+            reception.chaos = chaos
+            player.set_filter(vf)
+            timer.tick()
 
 
 if __name__ == "__main__":
@@ -101,6 +101,7 @@
               ))
               pyserial
               python-mpv-jsonipc
+              orjson
               (disableTests textual)
 
               # Development tools
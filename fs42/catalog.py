@@ -56,7 +56,7 @@ class ShowCatalog:
     def _write_catalog(self):
         with open(self.config["catalog_path"], "wb") as f:
             cat_out = {"version": 0.1, "clip_index": self.clip_index, "sequences": self.sequences}
-            pickle.dump(cat_out, f)
+            pickle.dump(cat_out, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load_catalog(self):
         if self.config["network_type"] == "streaming":
@@ -2,6 +2,7 @@ import logging
 import sqlite3
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.append(os.getcwd())
 
@@ -10,16 +11,28 @@ from fs42.media_processor import MediaProcessor
 from fs42.station_manager import StationManager
 
 class FluidBuilder:
+    # how many files worth of break points to detect before writing them out
+    break_batch_size = 25
+
     def __init__(self, db_path=None):
         if db_path is None:
-            self.db_path = StationManager().server_conf["db_path"]
+            db_path = StationManager().server_conf["db_path"]
+        self.db_path = db_path
 
         self._l = logging.getLogger("FLUID")
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
+            # WAL is persistent on the db file, so this only needs to happen once
+            connection.execute("PRAGMA journal_mode=WAL;")
             FluidStatements.init_db(connection)
 
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path)
+        # safe in WAL mode and avoids an fsync on every commit
+        connection.execute("PRAGMA synchronous=NORMAL;")
+        return connection
+
     def scan_file_cache(self, content_dir):
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
             # read all the files in the content dir
             self._l.info(f"Fluid file cache scan - reading {content_dir}")
             file_list = MediaProcessor.rich_find_media(content_dir)
@@ -29,18 +42,18 @@ class FluidBuilder:
             self._l.info("Checking file meta for stale entries.")
 
     def check_file_cache(self, full_path):
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
             results = FluidStatements.check_file_cache(connection, full_path)
 
         return results
 
     def trim_file_cache(self, from_time):
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
             self._l.info("Trimming fluid file cache")
             FluidStatements.trim_file_entries(connection, from_time)
 
     def scan_breaks(self, dir_path):
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
             
             self._l.info(f"Scanning directory {dir_path} for breaks")
             if not os.path.isdir(dir_path):
@@ -50,28 +63,42 @@ class FluidBuilder:
 
             # Check the cache because we require the duration to prococess.
             file_paths = [os.path.realpath(file) for file in file_list]
-            cached_files = {}
-            for path in file_paths:
-                cached = FluidStatements.check_file_cache(connection, path)
-                if cached:
-                    cached_files[path] = cached
-
-            for file in file_list:
-                rfp = os.path.realpath(file)
+            cached_files = FluidStatements.check_file_cache_bulk(connection, file_paths)
+
+            todo = []
+            for rfp in file_paths:
                 if rfp in cached_files:
                     cached = cached_files[rfp]
                     if FluidStatements.get_break_points(connection, rfp):
                         self._l.info(f"Breaks already exists for {rfp}")
                     else:
-                        breaks = MediaProcessor.black_detect(rfp, cached.duration)
-                        FluidStatements.add_break_points(connection, rfp, breaks)
+                        todo.append((rfp, cached.duration))
                 else:
                     self._l.warning(f"{rfp} is not in catalog cache - not adding break points.")
-            connection.commit()
+
+            # the detection work happens in the ffmpeg child processes, so threads are enough to run them side by side
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                futures = {pool.submit(MediaProcessor.black_detect, *job): job[0] for job in todo}
+                breaks_to_insert = []
+                for future in as_completed(futures):
+                    rfp = futures[future]
+                    try:
+                        breaks_to_insert.append((rfp, future.result()))
+                    except Exception as e:
+                        self._l.error(f"Could not detect breaks for {rfp} - skipping it")
+                        self._l.exception(e)
+                        continue
+                    # write as we go so a long scan doesn't lose everything if it stops part way
+                    if len(breaks_to_insert) >= self.break_batch_size:
+                        FluidStatements.add_break_points_bulk(connection, breaks_to_insert)
+                        breaks_to_insert = []
+
+            if breaks_to_insert:
+                FluidStatements.add_break_points_bulk(connection, breaks_to_insert)
 
     def get_breaks(self, fname):
         fname = os.path.realpath(fname)
-        with sqlite3.connect(self.db_path) as connection:
+        with self._connect() as connection:
             results = FluidStatements.get_break_points(connection, fname)
         return results
 
@@ -3,6 +3,7 @@ import sqlite3
 import datetime
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fs42.media_processor import MediaProcessor
 from fs42.fluid_objects import FileRepoEntry
 
@@ -10,6 +11,10 @@ from fs42.fluid_objects import FileRepoEntry
 class FluidStatements:
     """Basic static SQL functions for interacting with the Fluid catalog DB"""
 
+    bulk_chunk_size = 900
+    # how many probed files to write out per commit during a cache scan
+    commit_batch_size = 50
+
     @staticmethod
     def check_file_cache(connection: sqlite3.Connection, full_path) -> FileRepoEntry:
         """Find full_path and return fullpath if its in the file cache"""
@@ -24,27 +29,99 @@ class FluidStatements:
         cursor.close()
         return result
 
+    @staticmethod
+    def check_file_cache_bulk(connection: sqlite3.Connection, full_paths: list[str]) -> dict[str, FileRepoEntry]:
+        """Look up many paths at once, returns a dict of path to entry for those in the file cache"""
+
+        results = {}
+        cursor = connection.cursor()
+        # stay under sqlite's host parameter limit
+        for i in range(0, len(full_paths), FluidStatements.bulk_chunk_size):
+            chunk = full_paths[i : i + FluidStatements.bulk_chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT * FROM file_meta WHERE path IN ({placeholders});", chunk)
+            for row in cursor.fetchall():
+                repo_entry = FileRepoEntry(row)
+                results[repo_entry.path] = repo_entry
+        cursor.close()
+        return results
+
     @staticmethod
     def iterate_file_entries(connection: sqlite3.Connection, entries: list[FileRepoEntry]) -> None:
         """Takes a list of file entries, determines if they are cached and adds them if not."""
 
-        cursor = connection.cursor()
+        cached = FluidStatements.check_file_cache_bulk(connection, [entry.path for entry in entries])
+
+        # compare against the stats in the repo - only new or changed files need to be probed
+        to_add = []
+        to_update = []
+        seen = set()
         for entry in entries:
-            # see if there is an entry already
-            cursor.execute("SELECT * FROM file_meta WHERE path = ?;", (entry.path,))
-            row = cursor.fetchone()
-            if row:
-                repo_entry = FileRepoEntry()
-                repo_entry.from_db_row(row)
-
-                # compare it to the stats in the repo
-                if entry != repo_entry:
-                    # then the stats match
-                    FluidStatements.update_file_entry(connection, entry)
-
-            else:
-                FluidStatements.add_file_entry(connection, entry)
+            # symlinked content can resolve to the same path more than once
+            if entry.path in seen:
+                continue
+            seen.add(entry.path)
+            if entry.path not in cached:
+                to_add.append(entry)
+            elif entry != cached[entry.path]:
+                to_update.append(entry)
+
+        # probing spends its time waiting on ffprobe, so run those side by side
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(FluidStatements._probe_entry, entry): (entry.path, True) for entry in to_add}
+            for entry in to_update:
+                futures[pool.submit(FluidStatements._probe_entry, entry)] = (entry.path, False)
+
+            add_rows = []
+            update_rows = []
+            for future in as_completed(futures):
+                path, is_new = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logging.getLogger("FLUID").error(f"Could not probe {path} - skipping it")
+                    logging.getLogger("FLUID").exception(e)
+                    continue
+                if not entry:
+                    continue
+
+                now = datetime.datetime.now()
+                if is_new:
+                    entry.first_added = now
+                    entry.last_checked = now
+                    entry.last_updates = now
+                    logging.getLogger("FLUID").info(f"Caching new file entry: {entry}")
+                    add_rows.append(entry.to_db_row())
+                else:
+                    logging.getLogger("FLUID").info(f"Updating existing file entry: {entry.path}")
+                    update_rows.append((entry.duration, entry.size, entry.last_mod, now, now, entry.path))
+
+                # commit as we go so a long scan keeps what it has probed if it stops part way
+                if len(add_rows) + len(update_rows) >= FluidStatements.commit_batch_size:
+                    FluidStatements._write_file_entries(connection, add_rows, update_rows)
+                    add_rows = []
+                    update_rows = []
+
+        FluidStatements._write_file_entries(connection, add_rows, update_rows)
+
+    @staticmethod
+    def _write_file_entries(connection: sqlite3.Connection, add_rows: list, update_rows: list):
+        cursor = connection.cursor()
+        cursor.executemany("INSERT INTO file_meta VALUES (?, ?, ?, ?, ?, ?, ?, ?);", add_rows)
+        cursor.executemany(
+            "UPDATE file_meta SET duration=?, size=?, last_mod=?, last_updated=?, last_checked=? WHERE path=?;",
+            update_rows,
+        )
         cursor.close()
+        connection.commit()
+
+    @staticmethod
+    def _probe_entry(entry: FileRepoEntry) -> FileRepoEntry:
+        processed = MediaProcessor.process_one(entry.path, "processing", [])
+        if not processed:
+            return None
+        entry.duration = processed.duration
+        return entry
 
     @staticmethod
     def trim_file_entries(connection: sqlite3.Connection, older_than: datetime):
@@ -71,55 +148,12 @@ class FluidStatements:
         connection.commit()
 
     @staticmethod
-    def update_file_entry(connection: sqlite3.Connection, entry: FileRepoEntry):
-        """An old entry has changed, get the new stats and update it."""
-        cursor = connection.cursor()
+    def add_break_points_bulk(connection: sqlite3.Connection, points_by_path: list[tuple[str, dict]]):
+        """Add or update break points for many files in a single transaction"""
         now = datetime.datetime.now()
-
-        processed = MediaProcessor.process_one(entry.path, "processing", [])
-        if not processed:
-            return False
-        entry.duration = processed.duration
-
-        logging.getLogger("FLUID").info(f"Updating existing file entry: {entry.path}")
-
-        update = """UPDATE file_meta SET duration=?, size=?, last_mod=?, last_updated=?, last_checked=? 
-        WHERE path=?;
-        """
-        values = (entry.duration, entry.size, entry.last_mod, now, now, entry.path)
-        cursor.execute(update, values)
-        cursor.close()
-        connection.commit()
-
-    @staticmethod
-    def add_file_entry(connection: sqlite3.Connection, entry: FileRepoEntry):
-        """This file isn't in the cache - add it."""
+        rows = [(path, json.dumps(points), now) for path, points in points_by_path]
         cursor = connection.cursor()
-        now = datetime.datetime.now()
-
-        entry.first_added = now
-        entry.last_checked = now
-        entry.last_updates = now
-
-        processed = MediaProcessor.process_one(entry.path, "processing", [])
-        if not processed:
-            return False
-
-        entry.duration = processed.duration
-
-        logging.getLogger("FLUID").info(f"Caching new file entry: {entry}")
-
-        cursor.execute("INSERT INTO file_meta VALUES (?, ?, ?, ?, ?, ?, ?, ?);", entry.to_db_row())
-        cursor.close()
-        connection.commit()
-
-    @staticmethod
-    def add_break_points(connection: sqlite3.Connection, path: str, points: dict):
-        """Add or update the break points for this file"""
-        cursor = connection.cursor()
-        now = datetime.datetime.now()
-        json_points = json.dumps(points)
-        cursor.execute("REPLACE INTO break_points VALUES(?, ?, ?)", (path, json_points, now))
+        cursor.executemany("REPLACE INTO break_points VALUES(?, ?, ?)", rows)
         cursor.close()
         connection.commit()
 
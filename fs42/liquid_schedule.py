@@ -62,7 +62,7 @@ class LiquidSchedule:
     def _save_blocks(self):
         # save blocks to disk
         with open(self.conf["schedule_path"], "wb") as f:
-            pickle.dump(self._blocks, f)
+            pickle.dump(self._blocks, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _end_time(self):
         # get the lastest time in the schedule
@@ -18,6 +18,7 @@ from fs42.catalog_entry import CatalogEntry
 
 class MediaProcessor:
     supported_formats = ["mp4", "mpg", "mpeg", "avi", "mov", "mkv", "ts", "m4v"]
+    _supported_extensions = frozenset(supported_formats)
 
     def process_one(fname, tag, hints, fluid=None) -> CatalogEntry:
         _l = logging.getLogger("MEDIA")
@@ -116,14 +117,14 @@ class MediaProcessor:
 
     @staticmethod
     def rich_find_media(path: str) -> list[FileRepoEntry]:
-        file_list = MediaProcessor._rfind_media(path)
         found_list = []
 
-        for fp in file_list:
+        for dir_entry in MediaProcessor._scan_media(path):
             entry = FileRepoEntry()
-            entry.path = os.path.realpath(fp)
             # get the full path:
-            stat = os.stat(fp)
+            entry.path = os.path.realpath(dir_entry.path)
+            # DirEntry caches its stat result, so this is at most one syscall per file
+            stat = dir_entry.stat()
             entry.last_mod = stat.st_mtime
             entry.size = stat.st_size
             found_list.append(entry)
@@ -132,17 +133,42 @@ class MediaProcessor:
     @staticmethod
     def _rfind_media(path) -> list[str]:
         logging.getLogger("MEDIA").debug(f"_rfind_media scanning for media in {path}")
-        file_list = []
-
-        # get all the files
-        for ext in MediaProcessor.supported_formats:
-            # this_format = directory.rglob(f"*.{ext}")
-            this_format = glob.glob(f"{path}/**/*.{ext}", recursive=True)
-            file_list += this_format
-
+        file_list = [dir_entry.path for dir_entry in MediaProcessor._scan_media(path)]
         logging.getLogger("MEDIA").debug(f"_rfind_media done scanning {path} {len(file_list)}")
         return file_list
 
+    @staticmethod
+    def _scan_media(path, _visited=None):
+        # walks the tree once with scandir rather than a recursive glob per supported format
+        # hidden files and directories are skipped, same as glob
+        # files come back in tree order, not grouped by extension as the per-format globs returned them
+        try:
+            if _visited is None:
+                st = os.stat(path)
+                _visited = {(st.st_dev, st.st_ino)}
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for dir_entry in entries:
+            if dir_entry.name.startswith("."):
+                continue
+            if dir_entry.is_dir():
+                # directory symlinks are followed, so only descend into each real directory once
+                try:
+                    st = dir_entry.stat()
+                except OSError:
+                    continue
+                key = (st.st_dev, st.st_ino)
+                if key in _visited:
+                    continue
+                _visited.add(key)
+                yield from MediaProcessor._scan_media(dir_entry.path, _visited)
+            elif os.path.splitext(dir_entry.name)[1][1:] in MediaProcessor._supported_extensions:
+                if dir_entry.is_file():
+                    yield dir_entry
+
     @staticmethod
     def _process_hints(path, tag, bumpdir=False):
         base = os.path.basename(path)
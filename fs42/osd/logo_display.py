@@ -1,4 +1,3 @@
-import json
 import sys
 from pathlib import Path
 import glfw
@@ -15,6 +14,7 @@ sys.path.insert(0, str(project_root))
 
 from fs42.station_manager import StationManager
 from fs42.osd.content_classifier import ContentClassifier, ContentType, classify_current_content # ContentClassifier unused
+from fs42.osd.status_reader import read_status
 
 SOCKET_FILE = "runtime/play_status.socket"
 
@@ -62,6 +62,7 @@ class LogoDisplay(object):
         self.available_logos = [] 
         self.current_logo_path = None
         self.is_displaying_osd_default_logo = False 
+        self._status_version = None
         self.check_status()
 
     def get_available_logos(self, logo_dir_path):
@@ -113,10 +114,11 @@ class LogoDisplay(object):
 
     def check_status(self, socket_file=SOCKET_FILE):
         try:
-            with open(socket_file, "r") as f:
-                status = f.read()
-                status = json.loads(status)
-
+            version, status = read_status(socket_file)
+            if version == self._status_version:
+                return
+            self._status_version = version
+            if status is not None:
                 current_network = self.current_channel_info.get("network_name")
                 current_title = self.current_channel_info.get("title")
                 new_network = status.get("network_name")
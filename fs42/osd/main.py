@@ -1,5 +1,6 @@
 import json
 import sys
+from collections import defaultdict
 from pathlib import Path
 import glfw
 from pydantic import BaseModel
@@ -14,6 +15,7 @@ sys.path.insert(0, str(project_root))
 
 from fs42.station_manager import StationManager
 from fs42.osd.content_classifier import ContentClassifier, ContentType, classify_current_content
+from fs42.osd.status_reader import read_status
 
 SOCKET_FILE = "runtime/play_status.socket"
 CONFIG_FILE_PATH = Path("osd/osd.json")
@@ -52,23 +54,24 @@ class StatusDisplay(object):
                           font=self.config.font)
 
         self.time_since_change = 0
+        self._status_version = None
+        self._format = self.config.format_text.format_map
 
         self.check_status()
 
     def check_status(self, socket_file=SOCKET_FILE):
-        with open(socket_file, "r") as f:
-            status = f.read()
-            try:
-                status = json.loads(status)
-            except:
-                print(f"Unable to parse player status, {status}")
-
-            else:
-                new_string = self.config.format_text.format(**status)
-                if new_string != self._text.string:
-                    self.time_since_change = -self.config.delay
-                    if new_string:
-                        self._text.string = new_string
+        version, status = read_status(socket_file)
+        if version == self._status_version:
+            return
+        self._status_version = version
+
+        if status is not None:
+            # fields missing from the status render as empty rather than raising KeyError
+            new_string = self._format(defaultdict(str, status))
+            if new_string != self._text.string:
+                self.time_since_change = -self.config.delay
+                if new_string:
+                    self._text.string = new_string
 
     def update(self, dt):
         self.time_since_change += dt
@@ -121,6 +124,9 @@ else:
     objects.append(StatusDisplay(window, config))
 
 
+# Draw objects with StatusDisplay on top - the object list doesn't change after loading
+draw_order = sorted(objects, key=lambda x: isinstance(x, StatusDisplay))
+
 # --------------------------
 # Main loop
 
@@ -135,8 +141,7 @@ while not glfw.window_should_close(window):
     for obj in objects:
         obj.update(delta_time)
 
-    # Draw objects with StatusDisplay on top
-    for obj in sorted(objects, key=lambda x: isinstance(x, StatusDisplay)):
+    for obj in draw_order:
         obj.draw()
 
     glfw.swap_buffers(window)
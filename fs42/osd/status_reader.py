@@ -0,0 +1,28 @@
+import os
+
+import orjson
+
+# the player status is shared by every osd object, so it is parsed once per write to the socket
+# rather than once per object per frame - the key is the socket's stat, which changes on every write
+_cache = {"key": None, "version": 0, "status": None}
+
+
+def read_status(socket_file):
+    """Returns (version, status) for the play status socket.
+
+    version increases each time the socket content changes, so callers can skip work when it hasn't.
+    status is None if the content couldn't be parsed.
+    """
+    st = os.stat(socket_file)
+    key = (socket_file, st.st_ino, st.st_mtime_ns, st.st_size)
+    if key != _cache["key"]:
+        with open(socket_file, "rb") as f:
+            contents = f.read()
+        try:
+            _cache["status"] = orjson.loads(contents)
+        except orjson.JSONDecodeError:
+            print(f"Unable to parse player status, {contents}")
+            _cache["status"] = None
+        _cache["key"] = key
+        _cache["version"] += 1
+    return _cache["version"], _cache["status"]
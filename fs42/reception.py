@@ -1,4 +1,38 @@
+import functools
 import random
+
+
+@functools.lru_cache(maxsize=256)
+def noise_filter(chaos):
+    # degrade/improve step by fixed amounts, so only a small set of chaos levels ever gets formatted
+    # between 0 and 100
+    noise = chaos * 100
+    # between 0 and .5
+    v_scroll = chaos * 0.5
+    return f"lavfi=[noise=alls={noise}:allf=t+u, scroll=h=0:v={v_scroll}]"
+
+
+@functools.lru_cache(maxsize=64)
+def transition_steps(chaos, step, thresh, improving):
+    """The (chaos, filter) for each step from chaos until perfect (improving) or degraded.
+
+    Same arithmetic as ReceptionStatus.improve/degrade, and deterministic, so a channel change
+    effect's whole sequence only gets worked out once.
+    """
+    steps = []
+    while (chaos != 0.0) if improving else not (chaos > thresh):
+        if improving:
+            chaos -= step
+            if chaos < thresh:
+                chaos = 0.0
+        else:
+            chaos += step
+            if chaos > 1.0:
+                chaos = 1.0
+        steps.append((chaos, noise_filter(chaos) if chaos > thresh else ""))
+    return tuple(steps)
+
+
 class ReceptionStatus(object):
     __we_are_all_one = {}
     chaos = 0
@@ -42,13 +76,15 @@ class ReceptionStatus(object):
         if self.chaos < self.thresh:
             self.chaos = 0.0
 
+    def degrade_steps(self, override=0):
+        return transition_steps(self.chaos, override or self.degrade_amount, self.thresh, False)
+
+    def improve_steps(self, override=0):
+        return transition_steps(self.chaos, override or self.improve_amount, self.thresh, True)
+
     def filter(self):
         if self.chaos > self.thresh:
-            # between 0 and 100
-            noise = self.chaos * 100
-            # between 0 and .5
-            v_scroll = self.chaos * 0.5
-            return f"lavfi=[noise=alls={noise}:allf=t+u, scroll=h=0:v={v_scroll}]"
+            return noise_filter(self.chaos)
         else:
             return ""
 
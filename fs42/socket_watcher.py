@@ -0,0 +1,117 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import selectors
+import struct
+import sys
+import time
+
+# from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_IGNORED = 0x00008000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # make sure this libc actually has inotify before we rely on it
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class SocketWatcher:
+    """Waits for one of the file based sockets (channel.socket, play_status.socket) to be written.
+
+    Uses inotify on linux so the caller can block until a writer closes the file instead of
+    polling it - falls back to sleeping for poll_interval everywhere else.
+    """
+
+    def __init__(self, path, poll_interval=0.05):
+        self._l = logging.getLogger("SocketWatcher")
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._wd = -1
+        self._selector = None
+
+        libc = _load_libc()
+        if libc is not None:
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                self._l.warning(f"inotify unavailable ({os.strerror(ctypes.get_errno())}) - polling {path}")
+            else:
+                self._libc = libc
+                self._fd = fd
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(fd, selectors.EVENT_READ)
+                self._arm()
+
+    @property
+    def is_polling(self):
+        return self._wd < 0
+
+    def fileno(self):
+        return self._fd
+
+    def _arm(self):
+        self._wd = self._libc.inotify_add_watch(self._fd, os.fsencode(self.path), IN_CLOSE_WRITE)
+
+    def drain(self):
+        # consume pending events, returns true if the watched file was written
+        written = False
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return written
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size + name_len
+                if mask & IN_CLOSE_WRITE:
+                    written = True
+                if mask & IN_IGNORED:
+                    # file was removed or replaced - watch is gone, so rearm on next wait
+                    self._wd = -1
+                    written = True
+
+    def ready(self):
+        """For callers selecting on fileno() themselves - consumes pending events without blocking.
+
+        Returns true if the file may have changed.
+        """
+        written = self.drain()
+        if self.is_polling:
+            self._arm()
+        return written
+
+    def wait(self, timeout=None):
+        """Block for up to timeout seconds (forever if None), returns true if the file may have changed."""
+        if self._fd is not None and self.is_polling:
+            self._arm()
+            if not self.is_polling:
+                # anything written while there was no watch went unseen, so report a possible change
+                return True
+
+        if self.is_polling:
+            time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return True
+
+        if self._selector.select(timeout):
+            return self.drain()
+        return False
+
+    def close(self):
+        if self._fd is not None:
+            self._selector.close()
+            os.close(self._fd)
+            self._fd = None
+            self._wd = -1
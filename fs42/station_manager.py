@@ -56,8 +56,6 @@ class StationManager(object):
                     "db_path": "runtime/fs42_fluid.db",
                     "start_mpv": True
                 }
-                self._number_index = {}
-                self._name_index = {}
                 self.load_main_config()
                 self.load_json_stations()
 
@@ -81,23 +79,17 @@ class StationManager(object):
                     else:
                         logging.getLogger().info("Guide channel checks completed.")
 
+            # smoothing replaces the station dicts, so build the lookup tables from the final list
+            self._build_indexes()
+
     def station_by_name(self, name):
-        if name in self._name_index:
-            return self._name_index[name]
-        return None
+        return self._name_index.get(name)
 
     def station_by_channel(self, channel_number):
-        if channel_number in self._number_index:
-            return self._number_index[channel_number]
-        return None
+        return self._number_index.get(channel_number)
 
     def index_from_channel(self, channel):
-        index = 0
-        for station in self.stations:
-            if station["channel_number"] == channel:
-                return index
-            index += 1
-        return None
+        return self._channel_index.get(channel)
 
     def get_day_parts(self):
         return self.server_conf["day_parts"]
@@ -234,7 +226,10 @@ class StationManager(object):
 
         self.stations = sorted(station_buffer, key=lambda station: station["channel_number"])
 
-        # make index
-        for station in self.stations:
-            self._name_index[station["network_name"]] = station
-            self._number_index[station["channel_number"]] = station
+    def _build_indexes(self):
+        self._name_index = {station["network_name"]: station for station in self.stations}
+        self._number_index = {station["channel_number"]: station for station in self.stations}
+        # built in reverse so the first station wins on a duplicate channel number, same as the old linear scan
+        self._channel_index = {
+            self.stations[i]["channel_number"]: i for i in range(len(self.stations) - 1, -1, -1)
+        }
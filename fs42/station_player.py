@@ -1,12 +1,16 @@
 from enum import Enum
 import logging
 
+import functools
 import multiprocessing
+import queue
+import threading
 import time
 import datetime
-import json
 import os
 
+import orjson
+
 from python_mpv_jsonipc import MPV
 
 from fs42.guide_tk import guide_channel_runner, GuideCommands
@@ -15,12 +19,21 @@ from fs42.liquid_manager import LiquidManager, PlayPoint, ScheduleNotFound, Sche
 
 from fs42.liquid_schedule import LiquidSchedule
 from fs42.station_manager import StationManager
+from fs42.socket_watcher import SocketWatcher
 
 logging.basicConfig(format="%(asctime)s %(levelname)s:%(name)s:%(message)s", level=logging.INFO)
 
+DEFAULT_TS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+@functools.cache
+def _server_conf():
+    # StationManager is a borg and server_conf is fixed once loaded, so only look it up once
+    return StationManager().server_conf
+
 
 def check_channel_socket():
-    channel_socket = StationManager().server_conf["channel_socket"]
+    channel_socket = _server_conf()["channel_socket"]
     with open(channel_socket, "r") as r_sock:
         contents = r_sock.read()
     if len(contents):
@@ -30,14 +43,23 @@ def check_channel_socket():
     return None
 
 
+def format_hms(seconds):
+    # same output as str(datetime.timedelta(seconds=seconds)) for anything under a day
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}"
+
+
 def update_status_socket(
-    status, network_name, channel, title=None, timestamp="%Y-%m-%dT%H:%M:%S", duration=None, file_path=None
+    status, network_name, channel, title=None, timestamp=DEFAULT_TS_FORMAT, duration=None, file_path=None
 ):
+    now = datetime.datetime.now()
     status_obj = {
         "status": status,
         "network_name": network_name,
         "channel_number": channel,
-        "timestamp": datetime.datetime.now().strftime(timestamp),
+        # isoformat is much cheaper than strftime and matches the default format
+        "timestamp": now.isoformat(timespec="seconds") if timestamp == DEFAULT_TS_FORMAT else now.strftime(timestamp),
     }
     if title is not None:
         status_obj["title"] = title
@@ -45,10 +67,66 @@ def update_status_socket(
         status_obj["duration"] = duration
     if file_path is not None:
         status_obj["file_path"] = file_path
-    status_socket = StationManager().server_conf["status_socket"]
-    as_str = json.dumps(status_obj)
-    with open(status_socket, "w") as fp:
-        fp.write(as_str)
+    status_socket = _server_conf()["status_socket"]
+    as_bytes = orjson.dumps(status_obj)
+    # write to a temp file and rename it over the socket so readers never see a truncated/partial status
+    tmp_socket = status_socket + ".tmp"
+    fd = os.open(tmp_socket, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, as_bytes)
+    finally:
+        os.close(fd)
+    os.replace(tmp_socket, status_socket)
+
+
+class StatusWriter:
+    """Writes the status socket from a background thread, so the players never wait on the disk.
+
+    post() takes the same arguments as update_status_socket. Only the newest status matters, so
+    anything still queued behind it when the thread wakes up is skipped.
+    """
+
+    _stop = object()
+
+    def __init__(self):
+        self._l = logging.getLogger("StatusWriter")
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="StatusWriter", daemon=True)
+        self._thread.start()
+
+    def post(self, *args, **kwargs):
+        self._queue.put_nowait((args, kwargs))
+
+    def close(self, timeout=1.0):
+        """Write whatever is still queued and stop the thread"""
+        self._queue.put_nowait(self._stop)
+        self._thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            latest = None
+            item = self._queue.get()
+            while True:
+                if item is self._stop:
+                    stopping = True
+                else:
+                    latest = item
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if latest is not None:
+                args, kwargs = latest
+                try:
+                    update_status_socket(*args, **kwargs)
+                except OSError as e:
+                    self._l.error(f"Could not write the status socket: {e}")
+
+
+@functools.cache
+def status_writer():
+    return StatusWriter()
 
 
 class PlayStatus(Enum):
@@ -80,10 +158,10 @@ class StationPlayer:
     def __init__(self, station_config, mpv=None):
         self._l = logging.getLogger("FieldPlayer")
 
-        start_it = True
-
-        if "start_mpv" in StationManager().server_conf:
-            start_it = StationManager().server_conf["start_mpv"]
+        self.manager = StationManager()
+        server_conf = self.manager.server_conf
+        start_it = server_conf.get("start_mpv", True)
+        self.ts_format = server_conf.get("date_time_format", DEFAULT_TS_FORMAT)
 
         if not mpv:
             self._l.info("Starting MPV instance")
@@ -104,25 +182,40 @@ class StationPlayer:
         self.current_playing_file_path = None
         self.skip_reception_check = False
         self.scrambler = None
+        # the last filter sent to mpv
+        self._vf = None
+        self.channel_watcher = SocketWatcher(server_conf["channel_socket"])
 
     def show_text(self, text, duration=4):
         self.mpv.command("show-text", text, duration)
 
     def shutdown(self):
         self.current_playing_file_path = None
+        self.channel_watcher.close()
         self.mpv.terminate()
 
     def update_filters(self):
-        self.mpv.vf = self.reception.filter()
+        self.set_filter(self.reception.filter())
+
+    def set_filter(self, vf):
+        # every set is an ipc round trip to mpv, and the effects often ask for the filter that's already there
+        if vf != self._vf:
+            self.mpv.vf = vf
+            self._vf = vf
+
+    def _is_animating(self):
+        if self.skip_reception_check:
+            return self.scrambler is not None
+        return not self.reception.is_perfect()
 
     def update_reception(self):
         if not self.reception.is_perfect():
             self.reception.improve()
             # did that get us below threshhold?
             if self.reception.is_perfect():
-                self.mpv.vf = ""
+                self.set_filter("")
             else:
-                self.mpv.vf = self.reception.filter()
+                self.set_filter(self.reception.filter())
 
     def play_file(self, file_path, file_duration=None, current_time=None, is_stream=False):
         try:
@@ -133,21 +226,15 @@ class StationPlayer:
                 title, _ = os.path.splitext(basename)
                 if self.station_config:
                     self._l.debug("Got station config, updating status socket")
-                    if "date_time_format" in StationManager().server_conf:
-                        ts_format = StationManager().server_conf["date_time_format"]
-                    else:
-                        ts_format = "%Y-%m-%dT%H:%M:%S"
                     duration = (
-                        f"{str(datetime.timedelta(seconds=int(current_time)))}/{str(datetime.timedelta(seconds=int(file_duration)))}"
-                        if file_duration
-                        else "n/a"
+                        f"{format_hms(int(current_time))}/{format_hms(int(file_duration))}" if file_duration else "n/a"
                     )
-                    update_status_socket(
+                    status_writer().post(
                         "playing",
                         self.station_config["network_name"],
                         self.station_config["channel_number"],
                         title,
-                        timestamp=ts_format,
+                        timestamp=self.ts_format,
                         duration=duration,
                         file_path=file_path,
                     )
@@ -168,7 +255,7 @@ class StationPlayer:
 
                 if "video_scramble_fx" in self.station_config:
                     if self.station_config["video_scramble_fx"] in self.scramble_effects:
-                        self.mpv.vf = self.scramble_effects[self.station_config["video_scramble_fx"]]
+                        self.set_filter(self.scramble_effects[self.station_config["video_scramble_fx"]])
                         self.skip_reception_check = True  
                         if self.station_config["video_scramble_fx"] == "horizontal_line":
                             self.scrambler = HLScrambledVideoFilter()
@@ -180,7 +267,7 @@ class StationPlayer:
                         self._l.warning(f"Scrambler effect '{self.station_config['video_scramble_fx']}' does not exist.")  
                 else:                
                     self.skip_reception_check = False
-                    self.mpv.vf = ""
+                    self.set_filter("")
                     self.scrambler = None
 
                     # self.mpv.vf = "lavfi=[]"  
@@ -228,7 +315,8 @@ class StationPlayer:
             self.current_playing_file_path = None
         keep_going = True
         while keep_going:
-            time.sleep(0.05)
+            if not self.channel_watcher.wait():
+                continue
             response = check_channel_socket()
             if response:
                 self._l.info("Sending the guide channel shutdown command")
@@ -241,7 +329,7 @@ class StationPlayer:
     def schedule_panic(self, network_name):
         self._l.critical("*********************Schedule Panic*********************")
         self._l.critical(f"Schedule not found for {network_name} - attempting to generate a one-day extention")
-        schedule = LiquidSchedule(StationManager().station_by_name(network_name))
+        schedule = LiquidSchedule(self.manager.station_by_name(network_name))
         schedule.add_days(1)
         self._l.warning(f"Schedule extended for {network_name} - reloading schedules now")
         LiquidManager().reload_schedules()
@@ -292,24 +380,26 @@ class StationPlayer:
 
                     # this is our main event loop
                     keep_waiting = True
-                    stop_time = datetime.datetime.now() + datetime.timedelta(seconds=entry.duration - initial_skip)
+                    stop_time = time.monotonic() + (entry.duration - initial_skip)
                     while keep_waiting:
                         if not self.skip_reception_check:
                             self.update_reception()
                         else:
                             if self.scrambler:
-                                self.mpv.vf = self.scrambler.update_filter()
+                                self.set_filter(self.scrambler.update_filter())
                                 
-                        now = datetime.datetime.now()
+                        remaining = stop_time - time.monotonic()
 
-                        if now >= stop_time:
+                        if remaining <= 0:
                             keep_waiting = False
                         else:
-                            # debounce time
-                            time.sleep(0.05)
-                            response = check_channel_socket()
-                            if response:
-                                return response
+                            # only wake at the debounce rate while reception or scramble effects are animating,
+                            # otherwise sleep until the entry ends or the channel socket is written
+                            timeout = min(remaining, 0.05) if self._is_animating() else remaining
+                            if self.channel_watcher.wait(timeout):
+                                response = check_channel_socket()
+                                if response:
+                                    return response
                 else:
                     return PlayerOutcome(PlayStatus.FAILED)
 
@@ -0,0 +1,87 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+import time
+
+# from <sys/timerfd.h>
+CLOCK_MONOTONIC = 1
+TFD_CLOEXEC = os.O_CLOEXEC
+
+
+class _timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _timespec), ("it_value", _timespec)]
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.timerfd_create
+        libc.timerfd_settime
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _to_timespec(seconds):
+    whole = int(seconds)
+    return _timespec(whole, int((seconds - whole) * 1_000_000_000))
+
+
+class TickTimer:
+    """Fires every interval seconds, for loops that animate an effect at a steady rate.
+
+    Uses a timerfd on linux so ticks stay on the period no matter how long the work between them
+    took - falls back to sleeping until the next monotonic deadline everywhere else.
+    """
+
+    def __init__(self, interval):
+        self._l = logging.getLogger("TickTimer")
+        self.interval = interval
+        self._fd = None
+        self._next = time.monotonic() + interval
+
+        libc = _load_libc()
+        if libc is not None:
+            fd = libc.timerfd_create(CLOCK_MONOTONIC, TFD_CLOEXEC)
+            if fd < 0:
+                self._l.warning(f"timerfd unavailable ({os.strerror(ctypes.get_errno())}) - sleeping instead")
+                return
+            period = _to_timespec(interval)
+            spec = _itimerspec(period, period)
+            if libc.timerfd_settime(fd, 0, ctypes.byref(spec), None) < 0:
+                self._l.warning(f"timerfd_settime failed ({os.strerror(ctypes.get_errno())}) - sleeping instead")
+                os.close(fd)
+                return
+            self._fd = fd
+
+    def tick(self):
+        """Block until the next tick, returns how many ticks passed since the last call"""
+        if self._fd is not None:
+            return int.from_bytes(os.read(self._fd, 8), sys.byteorder)
+
+        now = time.monotonic()
+        if now < self._next:
+            time.sleep(self._next - now)
+            now = self._next
+        missed = int((now - self._next) / self.interval)
+        self._next += (missed + 1) * self.interval
+        return missed + 1
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -67,6 +67,16 @@ cp docs/brb.png runtime
 cp docs/off_air_pattern.mp4 runtime
 cp docs/signoff.mp4 runtime
 
+# the web player serves this pinned hls.js itself, keep the version in step with hls_js_version in web_field_player.py
+HLS_JS=hls-1.5.20.min.js
+if [ -f runtime/$HLS_JS ]; then
+  echo hls.js already downloaded - skipping
+else
+  echo Downloading $HLS_JS for the web player
+  python3 -c "import urllib.request; urllib.request.urlretrieve('https://cdn.jsdelivr.net/npm/hls.js@1.5.20/dist/hls.min.js', 'runtime/$HLS_JS')" \
+    || echo Could not download hls.js - the web player will only play HLS in browsers that support it natively
+fi
+
 touch runtime/channel.socket
 
 if [ -d catalog ]; then
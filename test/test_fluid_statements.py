@@ -0,0 +1,96 @@
+import sqlite3
+from fs42.fluid_statements import FluidStatements
+from fs42.fluid_objects import FileRepoEntry
+from fs42.media_processor import MediaProcessor
+from fs42.catalog_entry import CatalogEntry
+import pytest
+
+
+class TestFluidStatements:
+    @pytest.fixture
+    def connection(self):
+        connection = sqlite3.connect(":memory:")
+        FluidStatements.init_db(connection)
+        yield connection
+        connection.close()
+
+    def add_entry(self, connection, path, duration=30.0):
+        entry = FileRepoEntry()
+        entry.path = path
+        entry.duration = duration
+        connection.execute("INSERT INTO file_meta VALUES (?, ?, ?, ?, ?, ?, ?, ?);", entry.to_db_row())
+
+    def test_bulk_cache_check(self, connection, monkeypatch):
+        monkeypatch.setattr(FluidStatements, "bulk_chunk_size", 2)
+        paths = [f"/content/show_{i}.mp4" for i in range(5)]
+        for path in paths[:3]:
+            self.add_entry(connection, path)
+
+        found = FluidStatements.check_file_cache_bulk(connection, paths)
+        assert set(found.keys()) == set(paths[:3])
+        assert found[paths[0]].duration == 30.0
+
+    def test_bulk_cache_check_empty(self, connection):
+        assert FluidStatements.check_file_cache_bulk(connection, []) == {}
+
+    def test_bulk_break_points(self, connection):
+        points = [{"black_start": 300.0, "black_end": 301.0, "black_duration": 1.0}]
+        FluidStatements.add_break_points_bulk(connection, [("/content/a.mp4", points), ("/content/b.mp4", [])])
+        assert FluidStatements.get_break_points(connection, "/content/a.mp4") == points
+        assert FluidStatements.get_break_points(connection, "/content/b.mp4") == []
+
+    def test_iterate_file_entries(self, connection, monkeypatch):
+        probed = []
+
+        def fake_process(fname, tag, hints, fluid=None):
+            probed.append(fname)
+            return CatalogEntry(fname, 42.0, tag) if "broken" not in fname else None
+
+        monkeypatch.setattr(MediaProcessor, "process_one", fake_process)
+        self.add_entry(connection, "/content/cached.mp4")
+        self.add_entry(connection, "/content/changed.mp4")
+
+        entries = []
+        for path, size in [("/content/cached.mp4", 0), ("/content/changed.mp4", 10), ("/content/new.mp4", 5),
+                           ("/content/new.mp4", 5), ("/content/broken.mp4", 1)]:
+            entry = FileRepoEntry()
+            entry.path = path
+            entry.size = size
+            entries.append(entry)
+
+        FluidStatements.iterate_file_entries(connection, entries)
+
+        assert sorted(probed) == ["/content/broken.mp4", "/content/changed.mp4", "/content/new.mp4"]
+        assert FluidStatements.check_file_cache(connection, "/content/new.mp4").duration == 42.0
+        changed = FluidStatements.check_file_cache(connection, "/content/changed.mp4")
+        assert changed.size == 10 and changed.duration == 42.0
+        assert FluidStatements.check_file_cache(connection, "/content/broken.mp4") is None
+
+    def test_iterate_file_entries_batches_and_skips_errors(self, connection, monkeypatch):
+        def fake_process(fname, tag, hints, fluid=None):
+            if "corrupt" in fname:
+                raise RuntimeError("probe crashed")
+            return CatalogEntry(fname, 42.0, tag)
+
+        monkeypatch.setattr(MediaProcessor, "process_one", fake_process)
+        monkeypatch.setattr(FluidStatements, "commit_batch_size", 2)
+        commits = []
+        write = FluidStatements._write_file_entries
+        monkeypatch.setattr(
+            FluidStatements,
+            "_write_file_entries",
+            lambda conn, adds, updates: (commits.append(len(adds) + len(updates)), write(conn, adds, updates)),
+        )
+
+        entries = []
+        for path in ["/content/a.mp4", "/content/corrupt.mp4", "/content/b.mp4", "/content/c.mp4"]:
+            entry = FileRepoEntry()
+            entry.path = path
+            entries.append(entry)
+
+        FluidStatements.iterate_file_entries(connection, entries)
+
+        assert commits == [2, 1]
+        for path in ["/content/a.mp4", "/content/b.mp4", "/content/c.mp4"]:
+            assert FluidStatements.check_file_cache(connection, path).duration == 42.0
+        assert FluidStatements.check_file_cache(connection, "/content/corrupt.mp4") is None
@@ -0,0 +1,46 @@
+from fs42.reception import ReceptionStatus, noise_filter
+import pytest
+
+
+class TestReceptionStatus:
+    @pytest.fixture
+    def reception(self):
+        reception = ReceptionStatus()
+        reception.chaos = 0
+        yield reception
+        reception.chaos = 0
+
+    def test_perfect_has_no_filter(self, reception):
+        assert reception.is_perfect()
+        assert reception.filter() == ""
+
+    def test_degraded_filter(self, reception):
+        reception.degrade(0.5)
+        assert reception.is_degraded()
+        assert reception.filter() == "lavfi=[noise=alls=50.0:allf=t+u, scroll=h=0:v=0.25]"
+
+    def test_filter_is_memoized(self, reception):
+        noise_filter.cache_clear()
+        for _ in range(3):
+            reception.degrade()
+            reception.filter()
+            reception.improve()
+            reception.filter()
+        assert noise_filter.cache_info().currsize <= 2
+
+    def test_steps_match_degrade_and_improve(self, reception):
+        steps = reception.degrade_steps()
+        for chaos, vf in steps:
+            reception.degrade()
+            assert reception.chaos == chaos
+            assert reception.filter() == vf
+        assert reception.is_degraded()
+
+        reception.chaos = 0.5
+        steps = reception.improve_steps()
+        for chaos, vf in steps:
+            reception.improve()
+            assert reception.chaos == chaos
+            assert reception.filter() == vf
+        assert reception.is_perfect()
+        assert steps[-1] == (0.0, "")
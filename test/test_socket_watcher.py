@@ -0,0 +1,53 @@
+import time
+from fs42.socket_watcher import SocketWatcher
+import pytest
+
+
+class TestSocketWatcher:
+    @pytest.fixture
+    def socket_path(self, tmp_path):
+        path = tmp_path / "channel.socket"
+        path.write_text("")
+        return path
+
+    def test_wakes_on_write(self, socket_path):
+        watcher = SocketWatcher(str(socket_path))
+        with open(socket_path, "w") as fp:
+            fp.write('{"command": "up"}')
+        assert watcher.wait(1.0)
+        watcher.close()
+
+    def test_times_out_without_write(self, socket_path):
+        watcher = SocketWatcher(str(socket_path))
+        if watcher.is_polling:
+            pytest.skip("inotify not available")
+        start = time.monotonic()
+        assert not watcher.wait(0.1)
+        assert time.monotonic() - start >= 0.1
+        watcher.close()
+
+    def test_rearms_after_replace(self, socket_path):
+        watcher = SocketWatcher(str(socket_path))
+        if watcher.is_polling:
+            pytest.skip("inotify not available")
+        socket_path.unlink()
+        socket_path.write_text("")
+        # the old watch is dropped, so this reports a possible change and rearms
+        assert watcher.wait(1.0)
+        while watcher.wait(0.05):
+            pass
+        with open(socket_path, "w") as fp:
+            fp.write('{"command": "down"}')
+        assert watcher.wait(1.0)
+        watcher.close()
+
+    def test_ready_without_blocking(self, socket_path):
+        watcher = SocketWatcher(str(socket_path))
+        if watcher.is_polling:
+            pytest.skip("inotify not available")
+        assert not watcher.ready()
+        with open(socket_path, "w") as fp:
+            fp.write('{"command": "up"}')
+        assert watcher.ready()
+        assert not watcher.ready()
+        watcher.close()
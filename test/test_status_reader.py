@@ -0,0 +1,29 @@
+import os
+from fs42.osd.status_reader import read_status
+
+
+class TestStatusReader:
+    def test_reads_once_per_write(self, tmp_path):
+        socket_file = str(tmp_path / "play_status.socket")
+        with open(socket_file, "w") as fp:
+            fp.write('{"network_name": "NBC", "channel_number": 3}')
+
+        version, status = read_status(socket_file)
+        assert status == {"network_name": "NBC", "channel_number": 3}
+        again, _ = read_status(socket_file)
+        assert again == version
+
+        with open(socket_file, "w") as fp:
+            fp.write('{"network_name": "PBS", "channel_number": 10}')
+        # make sure the write is visible even on filesystems with coarse mtimes
+        os.utime(socket_file, ns=(0, os.stat(socket_file).st_mtime_ns + 1))
+        changed, status = read_status(socket_file)
+        assert changed != version
+        assert status["network_name"] == "PBS"
+
+    def test_bad_status(self, tmp_path):
+        socket_file = str(tmp_path / "play_status.socket")
+        with open(socket_file, "w") as fp:
+            fp.write("")
+        _, status = read_status(socket_file)
+        assert status is None
@@ -0,0 +1,26 @@
+import time
+from fs42.tick_timer import TickTimer
+import pytest
+
+
+class TestTickTimer:
+    def test_ticks_on_interval(self):
+        with TickTimer(0.02) as timer:
+            start = time.monotonic()
+            for _ in range(5):
+                assert timer.tick() == 1
+            assert time.monotonic() - start == pytest.approx(0.1, abs=0.03)
+
+    def test_reports_missed_ticks(self):
+        with TickTimer(0.02) as timer:
+            time.sleep(0.07)
+            assert timer.tick() >= 3
+
+    def test_sleeping_fallback(self):
+        timer = TickTimer(0.02)
+        timer.close()
+        timer._next = time.monotonic() + timer.interval
+        start = time.monotonic()
+        assert timer.tick() == 1
+        assert timer.tick() == 1
+        assert time.monotonic() - start == pytest.approx(0.04, abs=0.02)
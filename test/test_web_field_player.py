@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+import orjson
+import web_field_player
+from web_field_player import ChannelCommands, WebFieldPlayer
+from fs42.station_player import PlayStatus, PlayerOutcome
+from fastapi import HTTPException
+import pytest
+
+
+def read_socket(path):
+    contents = path.read_text()
+    if contents:
+        path.write_text("")
+        return PlayerOutcome(PlayStatus.CHANNEL_CHANGE, contents)
+    return None
+
+
+class TestChannelCommands:
+    @pytest.fixture
+    def commands(self, tmp_path):
+        path = tmp_path / "channel.socket"
+        path.write_text("")
+        commands = ChannelCommands(str(path))
+        yield commands
+        commands.watcher.close()
+
+    def test_quick_presses_are_all_delivered(self, commands):
+        async def run():
+            commands.submit({"command": "up"})
+            commands.submit({"command": "up"})
+            return [await commands.wait(0.1) for _ in range(3)]
+
+        first, second, third = asyncio.run(run())
+        assert first.status == PlayStatus.CHANNEL_CHANGE
+        assert orjson.loads(first.payload) == {"command": "up"}
+        assert orjson.loads(second.payload) == {"command": "up"}
+        assert third is None
+
+    def test_commands_after_socket_replaced(self, tmp_path, monkeypatch):
+        path = tmp_path / "channel.socket"
+        path.write_text("")
+        monkeypatch.setattr(web_field_player, "check_channel_socket", lambda: read_socket(path))
+        commands = ChannelCommands(str(path))
+        if commands.watcher.is_polling:
+            pytest.skip("inotify not available")
+
+        async def run():
+            watch = asyncio.create_task(commands.watch())
+            await asyncio.sleep(0.05)
+            # the watch goes with the old file, and the new one isn't there to rearm on straight away
+            path.unlink()
+            await asyncio.sleep(0.05)
+            path.write_text('{"command": "up"}')
+            first = await commands.wait(2.0)
+            path.write_text('{"command": "down"}')
+            second = await commands.wait(2.0)
+            watch.cancel()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert orjson.loads(first.payload) == {"command": "up"}
+        assert orjson.loads(second.payload) == {"command": "down"}
+
+    def test_wait_wakes_on_submit(self, commands):
+        async def run():
+            asyncio.get_running_loop().call_later(0.05, commands.submit, {"command": "down"})
+            return await commands.wait(1.0)
+
+        response = asyncio.run(run())
+        assert orjson.loads(response.payload) == {"command": "down"}
+
+
+class TestStatusPush:
+    def play(self, web_player, path):
+        web_player.player = SimpleNamespace(
+            current_playing_file_path=path,
+            current_stream_url=f"/stream/{path}",
+            get_current_title=lambda: path,
+            get_current_stream_url=lambda: f"/stream/{path}",
+        )
+
+    @pytest.fixture
+    def web_player(self):
+        # just the state broadcast_status works from, without starting the app or the guide
+        web_player = WebFieldPlayer.__new__(WebFieldPlayer)
+        web_player.logger = logging.getLogger("WebFieldPlayer")
+        web_player.manager = SimpleNamespace(stations=[{"channel_number": 3, "network_name": "NBC"}])
+        web_player.reception = SimpleNamespace(chaos=0.0)
+        web_player.current_channel_index = 0
+        web_player.websocket_connections = {}
+        web_player._status = None
+        web_player._status_key = None
+        web_player._status_bytes = None
+        web_player._sent_status = None
+        self.play(web_player, "first.mp4")
+        return web_player
+
+    def test_full_queue_restarts_from_full_status(self, web_player):
+        async def run():
+            queue = asyncio.Queue(maxsize=2)
+            queue.put_nowait(web_player.status_bytes())
+            web_player.websocket_connections["client"] = queue
+            await web_player.broadcast_status()
+            for name in ["second.mp4", "third.mp4", "fourth.mp4"]:
+                self.play(web_player, name)
+                await web_player.broadcast_status()
+
+            state = {}
+            while not queue.empty():
+                state.update(orjson.loads(queue.get_nowait()))
+            return state
+
+        assert asyncio.run(run()) == web_player.current_status()
+
+
+class TestHlsResponse:
+    @pytest.fixture
+    def web_player(self):
+        web_player = WebFieldPlayer.__new__(WebFieldPlayer)
+        web_player._segment_cache = {}
+        return web_player
+
+    def test_serves_segment(self, web_player, tmp_path):
+        (tmp_path / "seg_0.m4s").write_bytes(b"segment")
+        response = asyncio.run(web_player.hls_response(str(tmp_path), "seg_0.m4s"))
+        assert response.body == b"segment"
+
+    @pytest.mark.parametrize("segment", [".", "..", "missing.m4s", "../seg_0.m4s"])
+    def test_bad_segment_is_not_found(self, web_player, tmp_path, segment):
+        with pytest.raises(HTTPException) as raised:
+            asyncio.run(web_player.hls_response(str(tmp_path), segment))
+        assert raised.value.status_code == 404
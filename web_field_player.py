@@ -1,107 +1,400 @@
 import argparse
-import time
 import datetime
-import json
+import time
 import signal
 import logging
 import asyncio
-import threading
 import os
-from pathlib import Path
+import stat
+import gzip
+import hashlib
+import functools
+import collections
+import importlib.util
 from typing import Optional, Dict, Any
 import subprocess
+import shutil
+import tempfile
+import threading
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import ffmpeg
+import orjson
 
 from fs42.station_manager import StationManager
 from fs42.timings import MIN_1, DAYS
 from fs42.station_player import (
+    DEFAULT_TS_FORMAT,
     PlayStatus,
     PlayerOutcome,
     check_channel_socket,
-    update_status_socket,
+    format_hms,
+    status_writer,
 )
 from fs42.reception import ReceptionStatus
+from fs42.socket_watcher import SocketWatcher
+from fs42.media_processor import MediaProcessor
 from fs42.liquid_manager import LiquidManager, PlayPoint, ScheduleNotFound, ScheduleQueryNotInBounds
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)s:%(name)s:%(message)s", level=logging.INFO
 )
 
-debounce_fragment = 0.1
+# how long the page shows its static overlay for each transition
+short_static_ms = 500
+long_static_ms = 1500
+# one ffmpeg per channel writes HLS here, and every viewer is served the same segments
+live_root = os.path.join(tempfile.gettempdir(), "fs42", "live")
+live_playlist = "index.m3u8"
+# the guide is a single always-on encode, shared the same way
+guide_root = os.path.join(tempfile.gettempdir(), "fs42", "guide")
+guide_stream_url = f"/guide_stream/{live_playlist}"
+
+# pinned hls.js, fetched into runtime by install.sh and served from here rather than a floating cdn tag
+hls_js_version = "1.5.20"
+hls_js_name = f"hls-{hls_js_version}.min.js"
+hls_js_path = os.path.join("runtime", hls_js_name)
+# drawtext expands %{localtime} every frame, so the clock ticks without restarting the encoder
+guide_text = [
+    ("FieldStation42 Guide", 60, "(w-text_w)/2", 50),
+    (r"Current Time: %{localtime\:%X}", 40, 50, 150),
+    ("Use CH UP/DOWN to navigate", 30, 50, 200),
+]
+# the parts of the segmenter command that are the same for every file
+live_transcode_args = (
+    "-acodec", "aac",
+    "-b:v", "1M",
+    "-bufsize", "2M",
+    "-maxrate", "1M",
+    "-force_key_frames", "expr:gte(t,n_forced*2)",
+)
+live_output_args = (
+    "-f", "hls",
+    "-hls_time", "2",
+    "-hls_list_size", "6",
+    "-hls_flags", "delete_segments+append_list+independent_segments",
+    "-hls_segment_type", "fmp4",
+)
+image_extensions = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp"})
+# a miss in the video index triggers a rescan of the content dirs, but no more often than this
+video_index_rescan = 30.0
+# how long a file existence check is trusted for, the same file is often played back to back
+exists_ttl = 1.0
+# status socket writes are coalesced, a run of short clips only writes the last one
+status_flush_delay = 0.25
+# how long to rest between retries of a channel that failed to play
+failed_backoff_min = 1.0
+failed_backoff_max = 30.0
+
+
+# what a browser can play without us re-encoding
+browser_video_codecs = frozenset({"h264"})
+browser_audio_codecs = frozenset({"aac"})
+browser_pix_fmts = frozenset({"yuv420p", "yuvj420p"})
+
+vaapi_device = "/dev/dri/renderD128"
+# h264 encoders in order of preference, the software encoder always works so it goes last
+video_encoders = [
+    ("h264_nvenc", ["-vcodec", "h264_nvenc", "-preset", "p1", "-tune", "ll"]),
+    ("h264_vaapi", ["-vaapi_device", vaapi_device, "-vf", "format=nv12,hwupload", "-vcodec", "h264_vaapi"]),
+    ("h264_qsv", ["-vcodec", "h264_qsv", "-preset", "veryfast"]),
+    ("libx264", ["-vcodec", "libx264", "-preset", "veryfast", "-tune", "zerolatency"]),
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_codecs(path, mtime_ns):
+    # mtime is part of the key so a replaced file is probed again
+    try:
+        probed = ffmpeg.probe(path)
+    except (ffmpeg.Error, OSError):
+        return None
+    video = audio = pix_fmt = None
+    for stream in probed.get("streams", []):
+        if stream.get("codec_type") == "video" and video is None:
+            video = stream.get("codec_name")
+            pix_fmt = stream.get("pix_fmt")
+        elif stream.get("codec_type") == "audio" and audio is None:
+            audio = stream.get("codec_name")
+    return video, audio, pix_fmt
+
+
+@functools.lru_cache(maxsize=None)
+def video_encoder_args():
+    """ffmpeg args for the best h264 encoder this machine can actually use - checked once per process"""
+    logger = logging.getLogger("WebFieldPlayer")
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        listed = ""
+    for name, args in video_encoders[:-1]:
+        if name not in listed or (name == "h264_vaapi" and not os.path.exists(vaapi_device)):
+            continue
+        # being compiled in doesn't mean the hardware is there, so encode a single frame to find out
+        try:
+            trial = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "lavfi", "-i", "color=black:size=256x256",
+                 "-frames:v", "1", *args, "-f", "null", "-"],
+                stdin=subprocess.DEVNULL, capture_output=True, timeout=10,
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if trial.returncode == 0:
+            logger.info(f"Using hardware video encoder {name}")
+            return args
+    return video_encoders[-1][1]
+
+
+def can_remux(path):
+    """True if path is already h264/aac, so the live segmenter can copy it rather than transcode"""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+    codecs = _probe_codecs(path, mtime_ns)
+    if codecs is None:
+        return False
+    video, audio, pix_fmt = codecs
+    return (
+        video in browser_video_codecs
+        and pix_fmt in browser_pix_fmts
+        and (audio is None or audio in browser_audio_codecs)
+    )
+
+
+class PathRecord:
+    """What the web player needs to know about a plan entry's path, worked out once per path"""
+
+    __slots__ = ("path", "title", "stream_url")
+
+    def __init__(self, path, is_stream=False):
+        name = os.path.basename(path)
+        self.path = path
+        self.title = os.path.splitext(name)[0]
+        # local files are served by name from the content index, streams are handed to the page as-is
+        self.stream_url = path if is_stream else f"/stream/{name}"
+
+
+@functools.lru_cache(maxsize=1024)
+def path_record(path, is_stream=False):
+    return PathRecord(path, is_stream)
+
+
+class ChannelCommands:
+    """Collects channel change commands written to the channel socket for the playback loop.
+
+    The inotify fd from SocketWatcher is registered with the loop, and waiters are woken through an
+    asyncio.Event - so waiting playback only runs when a command arrives or its time is up. Commands
+    are queued, so presses that land before playback gets to them are each still acted on.
+    """
+
+    def __init__(self, channel_socket):
+        self.watcher = SocketWatcher(channel_socket)
+        self.event = asyncio.Event()
+        self.pending = collections.deque()
+        self._watch_lost = None
+
+    def _read_command(self):
+        try:
+            return check_channel_socket()
+        except FileNotFoundError:
+            # being replaced, whatever is written to the new file is picked up once it's watched
+            return None
+
+    def _next_command(self):
+        if self.watcher.wait(1.0):
+            return self._read_command()
+        return None
+
+    def _deliver(self, response):
+        if response:
+            self.pending.append(response)
+            self.event.set()
+
+    def submit(self, command):
+        """Queue a channel change from inside the process, shaped like a command written to the socket"""
+        self._deliver(PlayerOutcome(PlayStatus.CHANNEL_CHANGE, orjson.dumps(command)))
+
+    def _on_readable(self):
+        if self.watcher.ready():
+            self._deliver(self._read_command())
+        if self.watcher.is_polling and not self._watch_lost.done():
+            # the socket was replaced and couldn't be watched again yet, the fd won't wake us until it is
+            self._watch_lost.set_result(None)
+
+    async def watch(self):
+        try:
+            loop = asyncio.get_running_loop()
+            while True:
+                if self.watcher.fileno() is None or self.watcher.is_polling:
+                    # no inotify or no watch on the file right now - poll off the loop, each wait tries to rearm
+                    self._deliver(await asyncio.to_thread(self._next_command))
+                    continue
+
+                # the inotify fd is selectable, so let the loop itself wake us when a command is written
+                self._watch_lost = loop.create_future()
+                loop.add_reader(self.watcher.fileno(), self._on_readable)
+                try:
+                    await self._watch_lost
+                finally:
+                    loop.remove_reader(self.watcher.fileno())
+        finally:
+            self.watcher.close()
+
+    async def wait(self, timeout=None):
+        """Returns the next channel change outcome, or None if timeout passes first"""
+        if not self.pending:
+            self.event.clear()
+            try:
+                await asyncio.wait_for(self.event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.pending.popleft()
 
 
 class WebStationPlayer:
     """Web-based station player that streams video via HTTP instead of using MPV"""
     
-    def __init__(self, station_config):
+    def __init__(self, station_config, on_change=None, channel_commands=None, on_transition=None):
         self._l = logging.getLogger("WebFieldPlayer")
         self.station_config = station_config
+        self.on_transition = on_transition
+        self.channel_commands = channel_commands
+        # called whenever something shown in the web status changes
+        self.on_change = on_change
         self.current_playing_file_path = None
         self.current_stream_url = None
         self.reception = ReceptionStatus()
         self.skip_reception_check = False
         self.scrambler = None
         self.current_process = None
+        # bumped on every segmenter restart so the page reloads even when the same file plays again
+        self.live_generation = 0
+        # play_file runs in worker threads, so starting and stopping the segmenter is serialised
+        self._live_lock = threading.Lock()
+        self._live_closed = False
+        self.ts_format = StationManager().server_conf.get("date_time_format", DEFAULT_TS_FORMAT)
+        self._exists_cache = {}
+        self.loop = None
+        self._status_pending = None
+        self._status_flush = None
+
+    @property
+    def station_config(self):
+        return self._station_config
+
+    @station_config.setter
+    def station_config(self, station_config):
+        # the player is retuned on every channel change, pull out what play_file needs once per tune
+        self._station_config = station_config
+        self._network_name = station_config["network_name"] if station_config else None
+        self._channel_number = station_config["channel_number"] if station_config else None
         
+    def switch_station(self, station_config):
+        """Retune to another station - the segmenter for the old one has no viewers left, so it stops"""
+        self.stop_live()
+        self.station_config = station_config
+        self.current_playing_file_path = None
+        self.current_stream_url = None
+
     def shutdown(self):
         self.current_playing_file_path = None
         self.current_stream_url = None
-        if self.current_process:
-            self.current_process.kill()
-            self.current_process = None
+        if self._status_flush is not None:
+            self._status_flush.cancel()
+            self._status_flush = None
+        self._status_pending = None
+        with self._live_lock:
+            # a play_file still running in its thread must not start another segmenter after this
+            self._live_closed = True
+        self.stop_live()
+        self._changed()
+
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
         
+    def show_transition(self, duration_ms):
+        # the page draws the static itself, all the player does is say for how long
+        if self.on_transition:
+            self.on_transition(duration_ms)
+
     def update_filters(self):
         # Web player doesn't apply video filters directly
         # They would need to be applied at the video source level
-        pass
+        # but reception is part of the pushed status, so let clients know
+        self._changed()
         
     def update_reception(self):
         if not self.reception.is_perfect():
             self.reception.improve()
+            self._changed()
             
+    def post_status(self, *args, **kwargs):
+        """update_status_socket, but debounced and written off the loop - safe to call from any thread"""
+        self._status_pending = (args, kwargs)
+        if self.loop is None:
+            self._flush_status()
+        else:
+            self.loop.call_soon_threadsafe(self._schedule_flush)
+
+    def _schedule_flush(self):
+        if self._status_flush is None:
+            self._status_flush = self.loop.call_later(status_flush_delay, self._flush_status)
+
+    def _flush_status(self):
+        self._status_flush = None
+        pending, self._status_pending = self._status_pending, None
+        if pending is not None:
+            args, kwargs = pending
+            status_writer().post(*args, **kwargs)
+
+    def file_exists(self, file_path):
+        # content can be deleted under a loaded schedule, so every play looks at disk - a missing file then
+        # takes the FAILED/standby path instead of going to ffmpeg
+        now = time.monotonic()
+        cached = self._exists_cache.get(file_path)
+        if cached is not None and now - cached[0] < exists_ttl:
+            return cached[1]
+        if len(self._exists_cache) > 256:
+            self._exists_cache.clear()
+        exists = os.path.exists(file_path)
+        self._exists_cache[file_path] = (now, exists)
+        return exists
+
     def play_file(self, file_path, file_duration=None, current_time=None, is_stream=False):
         try:
-            if os.path.exists(file_path) or is_stream:
-                self._l.debug(f"%%%Attempting to play {file_path}")
+            if is_stream or self.file_exists(file_path):
+                self._l.debug("%%%%%%Attempting to play %s", file_path)
                 self.current_playing_file_path = file_path
                 
                 # Kill any existing stream
-                if self.current_process:
-                    self.current_process.kill()
-                    self.current_process = None
+                self.stop_live()
                 
                 # For web streaming, we need to serve the video file via HTTP
-                if is_stream:
-                    self.current_stream_url = file_path
-                else:
-                    # Convert local file path to web-accessible streaming URL
-                    self.current_stream_url = f"/stream/{Path(file_path).name}"
-                
-                basename = os.path.basename(file_path)
-                title, _ = os.path.splitext(basename)
+                record = path_record(file_path, is_stream)
+                self.live_generation += 1
+                separator = "&" if "?" in record.stream_url else "?"
+                self.current_stream_url = f"{record.stream_url}{separator}live={self.live_generation}"
+                title = record.title
                 
                 if self.station_config:
                     self._l.debug("Got station config, updating status socket")
-                    if "date_time_format" in StationManager().server_conf:
-                        ts_format = StationManager().server_conf["date_time_format"]
-                    else:
-                        ts_format = "%Y-%m-%dT%H:%M:%S"
                     duration = (
-                        f"{str(datetime.timedelta(seconds=int(current_time)))}/{str(datetime.timedelta(seconds=int(file_duration)))}"
-                        if file_duration
-                        else "n/a"
+                        f"{format_hms(int(current_time))}/{format_hms(int(file_duration))}" if file_duration else "n/a"
                     )
-                    update_status_socket(
+                    self.post_status(
                         "playing",
-                        self.station_config["network_name"],
-                        self.station_config["channel_number"],
+                        self._network_name,
+                        self._channel_number,
                         title,
-                        timestamp=ts_format,
+                        timestamp=self.ts_format,
                         duration=duration,
                         file_path=file_path,
                     )
@@ -110,7 +403,10 @@ class WebStationPlayer:
                         "station_config not available in play_file, cannot update status socket with title."
                     )
 
+                self.start_live(file_path, current_time or 0)
+
                 self._l.info(f"playing {file_path} via web stream at {self.current_stream_url}")
+                self._changed()
                 return True
             else:
                 self._l.error(
@@ -124,28 +420,83 @@ class WebStationPlayer:
             )
             return False
             
+    def live_dir(self, channel_number=None):
+        if channel_number is None:
+            channel_number = self._channel_number
+        return os.path.join(live_root, str(channel_number))
+
+    def start_live(self, source, offset=0):
+        """Starts the one ffmpeg that segments source for every viewer of this channel"""
+        if not self.station_config:
+            return
+        out_dir = self.live_dir()
+        # each file gets a fresh playlist, the new live_generation in stream_url is what makes the page reload it
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.makedirs(out_dir, exist_ok=True)
+
+        ffmpeg_cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+        is_image = os.path.splitext(source)[1].lower() in image_extensions
+        if is_image:
+            ffmpeg_cmd += ["-loop", "1"]
+        elif offset:
+            ffmpeg_cmd += ["-ss", str(offset)]
+        # read at the native rate, this is live tv rather than a download
+        ffmpeg_cmd += ["-re", "-i", source]
+        if not is_image and can_remux(source):
+            # already browser friendly - a remux is just I/O, segments get cut on the source's keyframes
+            ffmpeg_cmd += ["-c", "copy"]
+        else:
+            ffmpeg_cmd += video_encoder_args()
+            ffmpeg_cmd += live_transcode_args
+        ffmpeg_cmd += live_output_args
+        ffmpeg_cmd.append(os.path.join(out_dir, live_playlist))
+
+        self._l.debug("Starting live segmenter: %s", ffmpeg_cmd)
+        with self._live_lock:
+            if self._live_closed:
+                return
+            try:
+                self.current_process = subprocess.Popen(
+                    ffmpeg_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                self._l.error(f"Could not start ffmpeg for the live stream: {e}")
+                self.current_process = None
+
+    def stop_live(self):
+        with self._live_lock:
+            process, self.current_process = self.current_process, None
+        if process:
+            process.kill()
+            process.wait()
+
     def get_current_title(self):
         if self.current_playing_file_path:
-            basename = os.path.basename(self.current_playing_file_path)
-            title, _ = os.path.splitext(basename)
-            return title
+            return path_record(self.current_playing_file_path).title
         return None
         
     def get_current_stream_url(self):
         return self.current_stream_url
 
-    def show_guide(self, guide_config):
+    async def wait_for_channel_change(self, timeout):
+        if self.channel_commands is not None:
+            return await self.channel_commands.wait(timeout)
+        # no watcher to lean on, so poll the socket
+        await asyncio.sleep(min(timeout, 0.05))
+        return await asyncio.to_thread(check_channel_socket)
+
+    async def show_guide(self, guide_config):
         """Show guide channel - adapted for web streaming instead of tkinter"""
         self._l.info("Starting guide channel for web player")
         
         # Set up guide video stream
-        self.current_stream_url = "/guide_stream"
+        self.current_stream_url = guide_stream_url
+        self._changed()
         
         # Run the guide loop like the original player
         keep_going = True
         while keep_going:
-            time.sleep(0.05)
-            response = check_channel_socket()
+            response = await self.wait_for_channel_change(None if self.channel_commands else 0.05)
             if response:
                 self._l.info("Guide channel received channel change command")
                 return response
@@ -161,12 +512,13 @@ class WebStationPlayer:
         self._l.warning(f"Schedule extended for {network_name} - reloading schedules now")
         LiquidManager().reload_schedules()
 
-    def play_slot(self, network_name, when):
+    async def play_slot(self, network_name, when):
         liquid = LiquidManager()
         try:
-            play_point = liquid.get_play_point(network_name, when)
+            # schedule lookups and regeneration can hit the disk, keep them off the loop
+            play_point = await asyncio.to_thread(liquid.get_play_point, network_name, when)
         except (ScheduleNotFound, ScheduleQueryNotInBounds):
-            self.schedule_panic(network_name)
+            await asyncio.to_thread(self.schedule_panic, network_name)
             self._l.warning(f"Schedules reloaded - retrying play for: {network_name}")
             # fail so we can return and try again
             return PlayerOutcome(PlayStatus.FAILED)
@@ -174,10 +526,12 @@ class WebStationPlayer:
         if play_point is None:
             self.current_playing_file_path = None
             return PlayerOutcome(PlayStatus.FAILED)
-        return self._play_from_point(play_point)
+        return await self._play_from_point(play_point)
 
     # returns true if play is interrupted
-    def _play_from_point(self, play_point: PlayPoint):
+    # runs on the web server's loop, so waiting has to yield to it rather than sleep the thread
+    async def _play_from_point(self, play_point: PlayPoint):
+        self.loop = asyncio.get_running_loop()
         if len(play_point.plan):
             initial_skip = play_point.offset
 
@@ -192,7 +546,10 @@ class WebStationPlayer:
                 if hasattr(entry, "is_stream"):
                     is_stream = entry.is_stream
 
-                self.play_file(entry.path, file_duration=entry.duration, current_time=total_skip, is_stream=is_stream)
+                # starting the segmenter probes the file first, keep that off the loop
+                await asyncio.to_thread(
+                    self.play_file, entry.path, file_duration=entry.duration, current_time=total_skip, is_stream=is_stream
+                )
 
                 self._l.info(f"Seeking for: {total_skip}")
 
@@ -201,23 +558,24 @@ class WebStationPlayer:
 
                     # this is our main event loop
                     keep_waiting = True
-                    stop_time = datetime.datetime.now() + datetime.timedelta(seconds=entry.duration - initial_skip)
+                    check_reception = not self.skip_reception_check
+                    # the loop's clock is monotonic, so a wall clock adjustment can't cut an entry short
+                    clock = asyncio.get_running_loop().time
+                    stop_time = clock() + entry.duration - initial_skip
                     while keep_waiting:
-                        if not self.skip_reception_check:
+                        # the web player doesn't apply the scrambler, so there's nothing to do when reception is skipped
+                        if check_reception:
                             self.update_reception()
-                        else:
-                            if self.scrambler:
-                                # Web player doesn't apply filters directly
-                                pass
-                                
-                        now = datetime.datetime.now()
 
-                        if now >= stop_time:
+                        remaining = stop_time - clock()
+
+                        if remaining <= 0:
                             keep_waiting = False
                         else:
-                            # debounce time
-                            time.sleep(0.05)
-                            response = check_channel_socket()
+                            # only wake up on a timer while reception is still animating back in
+                            if not self.reception.is_perfect():
+                                remaining = min(remaining, 0.05)
+                            response = await self.wait_for_channel_change(remaining)
                             if response:
                                 return response
                 else:
@@ -239,14 +597,31 @@ class WebFieldPlayer:
         self.host = host
         self.port = port
         self.logger = logging.getLogger("WebFieldPlayer")
-        self.app = FastAPI(title="FieldStation42 Web Player")
+        self.app = FastAPI(title="FieldStation42 Web Player", default_response_class=ORJSONResponse)
         self.manager = StationManager()
         self.reception = ReceptionStatus()
         self.player = None
         self.current_channel_index = 0
-        self.websocket_connections = []
+        # websocket -> that client's outgoing queue, drained by its own writer task
+        self.websocket_connections = {}
+        self.loop = None
+        self.channel_commands = ChannelCommands(self.manager.server_conf["channel_socket"])
+        self._broadcast_pending = False
+        self._sent_status = None
         self.running = False
-        self.current_stream_process = None
+        self.guide_process = None
+        # segment path -> ((mtime, size), bytes) for the HLS segments being served right now
+        self._segment_cache = {}
+        if any(station["network_type"] == "guide" for station in self.manager.stations):
+            self.start_guide()
+        self.video_index = self.build_video_index()
+        self._video_index_time = time.monotonic()
+        self._status_key = None
+        self._status = None
+        self._status_bytes = None
+        # the pages never change at runtime, so encode and compress them once
+        self._index_page = self.encode_page(self.get_html_interface())
+        self._guide_page = self.encode_page(self.get_guide_html())
         
         # Setup CORS for web interface
         self.app.add_middleware(
@@ -260,197 +635,317 @@ class WebFieldPlayer:
         # Setup routes
         self.setup_routes()
         
-    def setup_routes(self):
-        @self.app.get("/")
-        async def root():
-            return HTMLResponse(self.get_html_interface())
-            
-        @self.app.get("/api/status")
-        async def get_status():
-            if self.player:
+    @staticmethod
+    def encode_page(html):
+        raw = html.encode("utf-8")
+        # weak, since the same tag covers the plain and compressed bodies
+        etag = f'W/"{hashlib.md5(raw).hexdigest()}"'
+        return raw, gzip.compress(raw, 9), etag
+
+    @staticmethod
+    def page_response(request, page):
+        raw, compressed, etag = page
+        headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding", "ETag": etag}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(compressed, media_type="text/html", headers=headers)
+        return Response(raw, media_type="text/html", headers=headers)
+
+    def tune_player(self, channel_conf):
+        """Points the player at channel_conf - one WebStationPlayer is kept across channel changes"""
+        if self.player is None:
+            self.player = WebStationPlayer(
+                channel_conf,
+                on_change=self.notify_status,
+                channel_commands=self.channel_commands,
+                on_transition=self.broadcast_transition,
+            )
+        else:
+            self.player.switch_station(channel_conf)
+        self.notify_status()
+        return self.player
+
+    def notify_status(self):
+        """Thread safe - schedules a status push to websocket clients on the server loop"""
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._schedule_broadcast)
+
+    def _schedule_broadcast(self):
+        # coalesce bursts of changes (reception animating) into one push per loop iteration
+        if not self._broadcast_pending:
+            self._broadcast_pending = True
+            self.loop.create_task(self.broadcast_status())
+
+    async def broadcast_status(self):
+        self._broadcast_pending = False
+        status = self.current_status()
+        # clients get the full status when they connect, after that only the fields that changed
+        if self._sent_status is None:
+            changed = status
+        else:
+            changed = {key: value for key, value in status.items() if self._sent_status.get(key) != value}
+        if not changed:
+            return
+        self._sent_status = status
+        self._push(orjson.dumps(changed))
+
+    def broadcast_transition(self, duration_ms):
+        self._push(orjson.dumps({"transition": "static", "ms": duration_ms}))
+
+    def _push(self, payload):
+        # hand the one encoded frame to every client's writer, a slow client only ever backs up its own queue
+        for queue in self.websocket_connections.values():
+            if queue.full():
+                # frames after the first are diffs, so dropping any of them would leave the client stale -
+                # start it over from the full status instead of waiting on it
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.status_bytes())
+            queue.put_nowait(payload)
+
+    async def _websocket_writer(self, websocket, queue):
+        try:
+            while True:
+                await websocket.send_bytes(await queue.get())
+        except Exception as e:
+            self.logger.debug("Dropping websocket client after failed send: %s", e)
+            self.websocket_connections.pop(websocket, None)
+
+    def status_bytes(self):
+        """Encoded /api/status payload, only rebuilt when the channel, the playing file or reception changes"""
+        status = self.current_status()
+        if self._status_bytes is None:
+            self._status_bytes = orjson.dumps(status)
+        return self._status_bytes
+
+    def current_status(self):
+        player = self.player
+        if player:
+            key = (
+                self.current_channel_index,
+                player.current_playing_file_path,
+                player.current_stream_url,
+                self.reception.chaos,
+            )
+        else:
+            key = None
+
+        if self._status is None or key != self._status_key:
+            if player:
+                station = self.manager.stations[self.current_channel_index]
                 status = {
-                    "channel": self.manager.stations[se∞lf.current_channel_index]["channel_number"],
-                    "name": self.manager.stations[self.current_channel_index]["network_name"],
-                    "title": self.player.get_current_title() or "",
-                    "stream_url": self.player.get_current_stream_url() or "",
+                    "channel": station["channel_number"],
+                    "name": station["network_name"],
+                    "title": player.get_current_title() or "",
+                    "stream_url": player.get_current_stream_url() or "",
                     "reception_quality": 1.0 - self.reception.chaos
                 }
-                self.logger.debug(f"Status: {status}")
-                return status
-            return {"channel": -1, "name": "", "title": "", "stream_url": "", "reception_quality": 0}
-            
-        @self.app.post("/api/channel/{channel_number}", response_model=dict)
-        async def change_channel(channel_number: int):
+                self.logger.debug("Status: %s", status)
+            else:
+                status = {"channel": -1, "name": "", "title": "", "stream_url": "", "reception_quality": 0}
+            self._status = status
+            self._status_bytes = None
+            self._status_key = key
+        return self._status
+
+    def start_guide(self):
+        """Starts the one ffmpeg that renders the guide for every viewer"""
+        shutil.rmtree(guide_root, ignore_errors=True)
+        os.makedirs(guide_root, exist_ok=True)
+        source = ",".join(
+            ["color=black:size=1280x720:rate=5"]
+            + [
+                f"drawtext=text='{text}':fontcolor=green:fontsize={size}:x={x}:y={y}:font=monospace"
+                for text, size, x, y in guide_text
+            ]
+        )
+        ffmpeg_cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-re", "-f", "lavfi", "-i", source,
+            *video_encoder_args(),
+            "-b:v", "500k",
+            "-bufsize", "1M",
+            "-maxrate", "500k",
+            # a keyframe every second so each segment starts on one
+            "-g", "5",
+            "-f", "hls",
+            "-hls_time", "1",
+            "-hls_list_size", "6",
+            "-hls_flags", "delete_segments+independent_segments",
+            "-hls_segment_type", "fmp4",
+            "-hls_segment_filename", os.path.join(guide_root, "seg%03d.m4s"),
+            os.path.join(guide_root, live_playlist),
+        ]
+        self.logger.debug("Starting guide encoder: %s", ffmpeg_cmd)
+        try:
+            self.guide_process = subprocess.Popen(
+                ffmpeg_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            self.logger.error(f"Could not start ffmpeg for the guide: {e}")
+            self.guide_process = None
+
+    def stop_guide(self):
+        if self.guide_process:
+            self.guide_process.kill()
+            self.guide_process.wait()
+            self.guide_process = None
+
+    def _read_segment(self, segment_path, key):
+        with open(segment_path, "rb") as f:
+            data = f.read()
+        if len(self._segment_cache) > 64:
+            self._segment_cache.clear()
+        self._segment_cache[segment_path] = (key, data)
+        return data
+
+    async def hls_response(self, out_dir, segment):
+        # segment comes from the url, so it may only name a file directly inside out_dir
+        if os.path.basename(segment) != segment:
+            raise HTTPException(status_code=404, detail="Segment not found")
+        segment_path = os.path.join(out_dir, segment)
+        try:
+            stat_result = os.stat(segment_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Segment not found")
+        if not stat.S_ISREG(stat_result.st_mode):
+            # "." and ".." get past the basename check and name the directories themselves
+            raise HTTPException(status_code=404, detail="Segment not found")
+        if segment.endswith(".m3u8"):
+            # the playlist is rewritten every segment
+            return FileResponse(
+                segment_path,
+                stat_result=stat_result,
+                media_type="application/vnd.apple.mpegurl",
+                headers={"Cache-Control": "no-cache"},
+            )
+        # segments never change once written, so every viewer is sent the same bytes - one read
+        # per segment rather than a threadpool hop per 64k chunk for every request
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._segment_cache.get(segment_path)
+        if cached is not None and cached[0] == key:
+            data = cached[1]
+        else:
             try:
-                new_index = self.manager.index_from_channel(channel_number)
-                if new_index is not None:
-                    self.current_channel_index = new_index
-                    await self.switch_channel()
-                    return {"status": "ok", "channel": channel_number}
-                else:
-                    raise HTTPException(status_code=404, detail=f"Channel {channel_number} not found")
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e))
-                
-        @self.app.post("/api/channel/up", response_model=dict)
+                data = await asyncio.to_thread(self._read_segment, segment_path, key)
+            except FileNotFoundError:
+                # rotated out between the stat and the read
+                raise HTTPException(status_code=404, detail="Segment not found")
+        return Response(data, media_type="video/mp4", headers={"Cache-Control": "public, max-age=60"})
+
+    def build_video_index(self):
+        """Map file names to paths under each station's content_dir, first station wins on duplicates"""
+        index = {}
+        for station in self.manager.stations:
+            if "content_dir" in station:
+                for dir_entry in MediaProcessor._scan_media(station["content_dir"]):
+                    index.setdefault(dir_entry.name, dir_entry.path)
+        self.logger.info(f"Indexed {len(index)} video files for streaming")
+        return index
+
+    def setup_routes(self):
+        @self.app.get("/")
+        async def root(request: Request):
+            return self.page_response(request, self._index_page)
+            
+        # polled by every client, registered as a plain starlette route so it skips FastAPI's
+        # parameter and response model handling - there's nothing to validate and the body is pre-encoded
+        async def get_status(request):
+            return Response(self.status_bytes(), media_type="application/json")
+
+        self.app.router.add_route("/api/status", get_status, methods=["GET"], include_in_schema=False)
+            
+        # channel changes are handed to the playback loop the same way the channel socket's commands are,
+        # so it wakes straight away - the tune itself happens after we reply, hence 202
+        # up/down come first so they aren't parsed as a channel number
+        @self.app.post("/api/channel/up", response_model=dict, status_code=202)
         async def channel_up():
             self.logger.info(f"Channel UP requested. Current: {self.current_channel_index}, Total stations: {len(self.manager.stations)}")
-            self.current_channel_index = (self.current_channel_index + 1) % len(self.manager.stations)
-            self.logger.info(f"New channel index: {self.current_channel_index}")
-            # Don't call switch_channel here as it's async and we're in a sync context
-            return {"status": "ok", "channel": self.manager.stations[self.current_channel_index]["channel_number"]}
+            self.channel_commands.submit({"command": "up"})
+            # presses queued ahead of this one haven't been applied yet, so where it lands isn't known here -
+            # the pushed status says once it happens
+            return {"status": "accepted"}
             
-        @self.app.post("/api/channel/down", response_model=dict)
+        @self.app.post("/api/channel/down", response_model=dict, status_code=202)
         async def channel_down():
             self.logger.info(f"Channel DOWN requested. Current: {self.current_channel_index}, Total stations: {len(self.manager.stations)}")
-            self.current_channel_index = (self.current_channel_index - 1) % len(self.manager.stations)
-            self.logger.info(f"New channel index: {self.current_channel_index}")
-            # Don't call switch_channel here as it's async and we're in a sync context
-            return {"status": "ok", "channel": self.manager.stations[self.current_channel_index]["channel_number"]}
+            self.channel_commands.submit({"command": "down"})
+            return {"status": "accepted"}
+
+        @self.app.post("/api/channel/{channel_number}", response_model=dict, status_code=202)
+        async def change_channel(channel_number: int):
+            if self.manager.index_from_channel(channel_number) is None:
+                raise HTTPException(status_code=404, detail=f"Channel {channel_number} not found")
+            self.channel_commands.submit({"command": "direct", "channel": channel_number})
+            return {"status": "accepted", "channel": channel_number}
             
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
-            self.websocket_connections.append(websocket)
+            queue = asyncio.Queue(maxsize=16)
+            queue.put_nowait(self.status_bytes())
+            self.websocket_connections[websocket] = queue
+            writer = asyncio.create_task(self._websocket_writer(websocket, queue))
             try:
-                while True:
-                    data = await websocket.receive_text()
-                    # Handle websocket messages if needed
-            except WebSocketDisconnect:
-                self.websocket_connections.remove(websocket)
+                # clients never send anything, this just waits for the disconnect - keepalive is left to
+                # the server's protocol level pings rather than decoding frames here
+                while (await websocket.receive())["type"] != "websocket.disconnect":
+                    pass
+            finally:
+                writer.cancel()
+                self.websocket_connections.pop(websocket, None)
                 
-        @self.app.get("/stream/{filename}")
+        # FileResponse already answers Range requests with 206s, HEAD lets players probe size and ranges first
+        @self.app.api_route("/stream/{filename}", methods=["GET", "HEAD"])
         async def serve_video(filename: str):
             # Serve video files from the content directories
-            for station in self.manager.stations:
-                if "content_dir" in station:
-                    video_path = Path(station["content_dir"]) / filename
-                    if video_path.exists():
-                        return FileResponse(str(video_path))
+            video_path = self.video_index.get(filename)
+            if video_path is None and time.monotonic() - self._video_index_time > video_index_rescan:
+                # content can be added while we run, pick it up without a restart
+                self._video_index_time = time.monotonic()
+                self.video_index = await asyncio.to_thread(self.build_video_index)
+                video_path = self.video_index.get(filename)
+            if video_path is not None:
+                try:
+                    stat_result = os.stat(video_path)
+                except FileNotFoundError:
+                    pass
+                else:
+                    # passing the stat along saves FileResponse another lookup, it still handles range requests
+                    return FileResponse(video_path, stat_result=stat_result)
             raise HTTPException(status_code=404, detail="Video not found")
             
-        @self.app.get("/live")
-        async def live_stream():
-            """Main live stream endpoint - serves whatever is currently playing"""
-            if not self.player or not self.player.current_playing_file_path:
-                # Return a placeholder or error
-                return HTMLResponse("No content currently playing", status_code=404)
-            
-            file_path = self.player.current_playing_file_path
-            
-            # Kill any existing stream process
-            if self.current_stream_process:
-                self.current_stream_process.kill()
-                self.current_stream_process = None
-            
-            # Check if it's a local file or external stream
-            if os.path.exists(file_path):
-                # Local file - transcode with ffmpeg
-                ffmpeg_cmd = [
-                    "ffmpeg",
-                    "-i", file_path,
-                    "-f", "mp4",
-                    "-vcodec", "libx264",
-                    "-acodec", "aac",
-                    "-movflags", "frag_keyframe+empty_moov+default_base_moof",
-                    "-preset", "veryfast",
-                    "-tune", "zerolatency",
-                    "-b:v", "1M",
-                    "-bufsize", "2M",
-                    "-maxrate", "1M",
-                    "-analyzeduration", "100M",
-                    "-probesize", "100M",
-                    "-y",
-                    "-loglevel", "error",
-                    "pipe:1"
-                ]
-                
-                self.logger.info(f"Starting live stream for: {file_path}")
-                self.logger.info(f"Running ffmpeg command: {' '.join(ffmpeg_cmd)}")
-                
-                self.current_stream_process = subprocess.Popen(
-                    ffmpeg_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    bufsize=10**6
-                )
-                
-                def iterfile():
-                    try:
-                        while True:
-                            chunk = self.current_stream_process.stdout.read(1024*1024)
-                            if not chunk:
-                                break
-                            yield chunk
-                    finally:
-                        if self.current_stream_process:
-                            self.current_stream_process.stdout.close()
-                            self.current_stream_process.stderr.close()
-                            self.current_stream_process.kill()
-                            self.current_stream_process = None
-                
-                return StreamingResponse(iterfile(), media_type="video/mp4")
-            else:
-                # External stream - proxy it
-                # This would need to be implemented based on the stream type
-                return HTMLResponse("External streams not yet supported", status_code=501)
+        @self.app.api_route("/live/{channel_number}/{segment}", methods=["GET", "HEAD"])
+        async def live_stream(channel_number: int, segment: str):
+            """HLS playlist and segments for whatever is currently playing on a channel"""
+            if not self.player:
+                raise HTTPException(status_code=404, detail="No content currently playing")
+            return await self.hls_response(self.player.live_dir(channel_number), segment)
             
         @self.app.get("/guide")
-        async def serve_guide():
+        async def serve_guide(request: Request):
             """Serve guide channel content"""
-            return HTMLResponse(self.get_guide_html())
-            
-        @self.app.get("/guide_stream")
-        async def stream_guide():
-            """Generate a dynamic guide video stream"""
-            self.logger.info("Generating guide video stream")
+            return self.page_response(request, self._guide_page)
             
-            # Create a simple animated guide using ffmpeg
-            # This creates a scrolling text guide with current time
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")
-            ffmpeg_cmd = [
-                "ffmpeg",
-                "-f", "lavfi",
-                "-i", f"color=black:size=1280x720:rate=1:duration=3600,drawtext=text='FieldStation42 Guide':fontcolor=green:fontsize=60:x=(w-text_w)/2:y=50:font=monospace,drawtext=text='Current Time: {current_time}':fontcolor=green:fontsize=40:x=50:y=150:font=monospace,drawtext=text='Use CH UP/DOWN to navigate':fontcolor=green:fontsize=30:x=50:y=200:font=monospace",
-                "-f", "mp4",
-                "-vcodec", "libx264",
-                "-preset", "veryfast",
-                "-tune", "zerolatency",
-                "-b:v", "500k",
-                "-bufsize", "1M",
-                "-maxrate", "500k",
-                "-g", "30",
-                "-keyint_min", "30",
-                "-sc_threshold", "0",
-                "-movflags", "frag_keyframe+empty_moov+default_base_moof",
-                "-y",
-                "-loglevel", "error",
-                "pipe:1"
-            ]
-
-            self.logger.info(f"Running guide ffmpeg command: {' '.join(ffmpeg_cmd)}")
-
-            process = subprocess.Popen(
-                ffmpeg_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=10**6
+        @self.app.api_route("/guide_stream/{segment}", methods=["GET", "HEAD"])
+        async def stream_guide(segment: str):
+            """HLS playlist and segments for the guide, rendered once for every viewer"""
+            return await self.hls_response(guide_root, segment)
+
+        @self.app.get(f"/static/{hls_js_name}")
+        async def serve_hls_js():
+            if not os.path.isfile(hls_js_path):
+                # the page falls back to native HLS playback without it
+                raise HTTPException(status_code=404, detail=f"{hls_js_path} not found - run install.sh")
+            # the version is in the name, so it never changes under this url
+            return FileResponse(
+                hls_js_path,
+                media_type="application/javascript",
+                headers={"Cache-Control": "public, max-age=31536000, immutable"},
             )
 
-            def iterfile():
-                try:
-                    while True:
-                        chunk = process.stdout.read(1024*1024)
-                        if not chunk:
-                            break
-                        yield chunk
-                finally:
-                    process.stdout.close()
-                    process.stderr.close()
-                    process.kill()
-
-            return StreamingResponse(iterfile(), media_type="video/mp4")
-            
         @self.app.get("/static/guide_placeholder.png")
         async def serve_guide_placeholder():
             """Serve a placeholder image for guide channels"""
@@ -559,6 +1054,19 @@ class WebFieldPlayer:
             background-color: #0f0;
             transition: width 0.3s;
         }
+        .static {
+            position: absolute;
+            inset: 0;
+            display: none;
+            background: repeating-radial-gradient(circle at 17% 32%, #fff 0, #000 1px, #777 2px, #111 3px);
+            background-size: 7px 5px;
+            animation: static-noise 0.1s steps(3) infinite;
+            opacity: 0.8;
+        }
+        @keyframes static-noise {
+            0% { background-position: 0 0; }
+            100% { background-position: 7px -5px; }
+        }
         .status {
             position: absolute;
             top: 10px;
@@ -576,6 +1084,7 @@ class WebFieldPlayer:
             <video id="videoPlayer" controls autoplay>
                 Your browser does not support the video tag.
             </video>
+            <div class="static" id="static"></div>
             <div class="status" id="status">
                 Loading...
             </div>
@@ -596,34 +1105,83 @@ class WebFieldPlayer:
         </div>
     </div>
 
+    <script src="/static/""" + hls_js_name + """"></script>
     <script>
-        let currentStreamUrl = '';
+        let currentChannel = null;
+        let hls = null;
+        const state = {};
         
-        async function updateStatus() {
-            try {
-                const response = await fetch('/api/status');
-                const status = await response.json();
-                
-                document.getElementById('channelNumber').textContent = status.channel || '--';
-                document.getElementById('channelName').textContent = status.name || 'No Signal';
-                document.getElementById('showTitle').textContent = status.title || '';
-                document.getElementById('receptionBar').style.width = (status.reception_quality * 100) + '%';
-                
-                // Always use the live stream endpoint
-                const video = document.getElementById('videoPlayer');
-                if (video.src !== '/live') {
-                    video.src = '/live';
-                    video.load();
-                    video.play().catch(e => console.log('Auto-play prevented:', e));
+        function playSource(url) {
+            const video = document.getElementById('videoPlayer');
+            if (hls) {
+                hls.destroy();
+                hls = null;
+            }
+            if (url.endsWith('.m3u8') && !video.canPlayType('application/vnd.apple.mpegurl') && window.Hls && Hls.isSupported()) {
+                // the segmenter needs a moment to write the first playlist, so keep retrying it
+                hls = new Hls({ manifestLoadingMaxRetry: 10, manifestLoadingRetryDelay: 500, liveSyncDurationCount: 2 });
+                hls.loadSource(url);
+                hls.attachMedia(video);
+            } else {
+                video.src = url;
+                video.load();
+            }
+            video.play().catch(e => console.log('Auto-play prevented:', e));
+        }
+        let currentStreamUrl = null;
+        
+        function applyStatus(status) {
+            document.getElementById('channelNumber').textContent = status.channel || '--';
+            document.getElementById('channelName').textContent = status.name || 'No Signal';
+            document.getElementById('showTitle').textContent = status.title || '';
+            document.getElementById('receptionBar').style.width = (status.reception_quality * 100) + '%';
+            
+            // Restart the stream when what's playing changes
+            if (status.channel !== currentChannel || status.stream_url !== currentStreamUrl) {
+                currentChannel = status.channel;
+                currentStreamUrl = status.stream_url;
+                if (status.stream_url.startsWith('/guide_stream')) {
+                    playSource(status.stream_url);
+                } else if (status.stream_url) {
+                    // every viewer shares the channel's HLS segments
+                    playSource(`/live/${status.channel}/index.m3u8`);
                 }
-                
-                document.getElementById('status').textContent = 
-                    `Quality: ${Math.round(status.reception_quality * 100)}%`;
-                    
-            } catch (error) {
-                console.error('Error updating status:', error);
-                document.getElementById('status').textContent = 'Connection Error';
             }
+            
+            document.getElementById('status').textContent = 
+                `Quality: ${Math.round(status.reception_quality * 100)}%`;
+        }
+        
+        let staticTimer = null;
+        
+        function showStatic(ms) {
+            const overlay = document.getElementById('static');
+            overlay.style.display = 'block';
+            clearTimeout(staticTimer);
+            staticTimer = setTimeout(() => { overlay.style.display = 'none'; }, ms);
+        }
+        
+        // The server pushes status over the websocket whenever it changes
+        function connectStatus() {
+            const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const ws = new WebSocket(`${protocol}//${location.host}/ws`);
+            ws.binaryType = 'arraybuffer';
+            const decoder = new TextDecoder();
+            
+            ws.onmessage = (event) => {
+                const data = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+                const message = JSON.parse(data);
+                if (message.transition) {
+                    showStatic(message.ms);
+                } else {
+                    // updates only carry what changed
+                    applyStatus(Object.assign(state, message));
+                }
+            };
+            ws.onclose = () => {
+                document.getElementById('status').textContent = 'Connection Error';
+                setTimeout(connectStatus, 2000);
+            };
         }
         
         async function changeChannel(direction) {
@@ -636,11 +1194,7 @@ class WebFieldPlayer:
             }
         }
         
-        // Update status every second
-        setInterval(updateStatus, 1000);
-        
-        // Initial status update
-        updateStatus();
+        connectStatus();
         
         // Keyboard controls
         document.addEventListener('keydown', (event) => {
@@ -733,48 +1287,77 @@ class WebFieldPlayer:
 </html>
         """
         
-    async def switch_channel(self):
-        """Switch to the current channel index"""
-        if not self.manager.stations:
-            self.logger.error("No stations configured")
-            return
-            
-        channel_conf = self.manager.stations[self.current_channel_index]
-        self.player = WebStationPlayer(channel_conf)
-        
-        # Notify websocket clients
-        status = {
-            "channel": channel_conf["channel_number"],
-            "name": channel_conf["network_name"],
-            "title": "",
-            "stream_url": "",
-            "reception_quality": 1.0 - self.reception.chaos
-        }
-        
-        for websocket in self.websocket_connections:
-            try:
-                await websocket.send_text(json.dumps(status))
-            except:
-                pass
+    async def switch_channel(self, channel_index):
+        """Tune the player to the station at channel_index and let clients know"""
+        self.current_channel_index = channel_index
+        player = self.tune_player(self.manager.stations[channel_index])
+        await self.broadcast_status()
+        return player
                 
-    async def start_server(self):
-        """Start the web server"""
-        config = uvicorn.Config(
+    def server_config(self):
+        # "auto" picks uvloop, httptools and websockets when they are installed and falls back to
+        # the pure python implementations otherwise - player state is in-process, so one worker only
+        if not (importlib.util.find_spec("uvloop") and importlib.util.find_spec("httptools")):
+            self.logger.info("uvloop/httptools not installed - install uvicorn[standard] for a faster web server")
+        return uvicorn.Config(
             self.app,
             host=self.host,
             port=self.port,
-            log_level="info"
+            log_level="info",
+            # a log line per request adds up with every client streaming and polling
+            access_log=False,
+            loop="auto",
+            http="auto",
+            ws="auto",
+            ws_ping_interval=20.0,
+            ws_ping_timeout=20.0,
+            workers=1,
         )
-        server = uvicorn.Server(config)
-        await server.serve()
+
+    async def start_server(self, server=None, background=()):
+        """Start the web server, along with any coroutines that should share its loop"""
+        self.loop = asyncio.get_running_loop()
+        if server is None:
+            server = uvicorn.Server(self.server_config())
+
+        def on_background_done(task):
+            # a crashed background task takes the server down with it rather than failing silently
+            if not task.cancelled() and task.exception() is not None:
+                self.logger.error("Background task failed", exc_info=task.exception())
+                server.should_exit = True
+
+        tasks = [self.loop.create_task(coro) for coro in (self.channel_commands.watch(), *background)]
+        for task in tasks:
+            task.add_done_callback(on_background_done)
+        try:
+            await server.serve()
+        finally:
+            for task in tasks:
+                task.cancel()
+            # let playback unwind before the players are shut down underneath it
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.shutdown()
+
+    def shutdown(self):
+        if self.player:
+            self.player.shutdown()
+        self.stop_guide()
+        self.running = False
+        # queued behind anything still pending, close waits for it to be written
+        status_writer().post("stopped", "", -1)
+        status_writer().close()
         
-    def run_server(self):
-        """Run the server in a separate thread"""
-        asyncio.run(self.start_server())
+    def run_server(self, *background):
+        """Run the server until it exits - blocks the calling thread"""
+        server = uvicorn.Server(self.server_config())
+        # let uvicorn set up the event loop - asyncio.run on its own would always use the default loop
+        server.config.setup_event_loop()
+        asyncio.run(self.start_server(server, background))
 
 
 def main_loop(transition_fn, host="0.0.0.0", port=9191):
     manager = StationManager()
+    stations = manager.stations
     reception = ReceptionStatus()
     logger = logging.getLogger("MainLoop")
     logger.info("Starting web field player main loop")
@@ -786,7 +1369,7 @@ def main_loop(transition_fn, host="0.0.0.0", port=9191):
         pass
 
     channel_index = 0
-    if not len(manager.stations):
+    if not len(stations):
         logger.error(
             "Could not find any station runtimes - do you have your channels configured?"
         )
@@ -800,97 +1383,103 @@ def main_loop(transition_fn, host="0.0.0.0", port=9191):
 
     # Create web player
     web_player = WebFieldPlayer(host=host, port=port)
-    web_player.player = WebStationPlayer(manager.stations[channel_index])
-    player = web_player.player  # Use the same player instance
+    player = web_player.tune_player(stations[channel_index])
     reception.degrade()
     player.update_filters()
 
-    def sigint_handler(sig, frame):
-        logger.critical("Received sig-int signal, attempting to exit gracefully...")
-        player.shutdown()
-        web_player.running = False
-        update_status_socket("stopped", "", -1)
-        logger.info("Shutdown completed as expected - exiting application")
-        exit(0)
+    def on_exit_signal(sig, frame):
+        # uvicorn handles SIGINT/SIGTERM itself while serving, then shuts down and raises the signal
+        # again once it's done - by then start_server has already cleaned up, so there's nothing to do
+        logger.critical(f"Received {signal.Signals(sig).name}, exiting...")
 
-    signal.signal(signal.SIGINT, sigint_handler)
+    signal.signal(signal.SIGINT, on_exit_signal)
+    signal.signal(signal.SIGTERM, on_exit_signal)
 
-    channel_conf = manager.stations[channel_index]
-
-    # Start web server in background thread
-    server_thread = threading.Thread(target=web_player.run_server, daemon=True)
-    server_thread.start()
-    
     logger.info(f"Web player started at http://{web_player.host}:{web_player.port}")
     logger.info("Open your browser to view the FieldStation42 web interface")
     
     # Debug: Show configured stations
-    logger.info(f"Configured stations: {len(manager.stations)}")
-    for i, station in enumerate(manager.stations):
-        logger.info(f"  {i}: {station['network_name']} (Channel {station['channel_number']}, Type: {station['network_type']})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Configured stations: %d", len(stations))
+        for i, station in enumerate(stations):
+            logger.info(
+                "  %d: %s (Channel %s, Type: %s)",
+                i, station["network_name"], station["channel_number"], station["network_type"],
+            )
+
+    # playback shares the server's loop, so web requests are served while it waits
+    web_player.run_server(play_loop(web_player, manager, reception, transition_fn))
+    logger.info("Shutdown completed as expected - exiting application")
+
+
+async def play_loop(web_player, manager, reception, transition_fn):
+    logger = logging.getLogger("MainLoop")
+    stations = manager.stations
+    n_stations = len(stations)
+    channel_index = web_player.current_channel_index
+    channel_conf = stations[channel_index]
+    # these only change with the channel, so look them up once per tune
+    net_type = channel_conf["network_type"]
+    net_name = channel_conf["network_name"]
+    chan_num = channel_conf["channel_number"]
+    standby = channel_conf.get("standby_image")
+    player = web_player.player
 
     # this is actually the main loop
     outcome = None
     skip_play = False
     stuck_timer = 0
+    backoff = failed_backoff_min
 
     while True:
-        logger.info(f"Playing station: {channel_conf['network_name']}")
+        logger.info("Playing station: %s", net_name)
 
-        if channel_conf["network_type"] == "guide" and not skip_play:
+        if net_type == "guide" and not skip_play:
             logger.info("Starting the guide channel")
-            outcome = player.show_guide(channel_conf)
+            outcome = await player.show_guide(channel_conf)
         elif not skip_play:
             now = datetime.datetime.now()
 
-            week_day = DAYS[now.weekday()]
-            hour = now.hour
-            skip = now.minute * MIN_1 + now.second
-
-            logger.info(
-                f"Starting station {channel_conf['network_name']} at: {week_day} {hour} skipping={skip} "
-            )
+            # the day/hour/skip are only worked out for the log line
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Starting station {net_name} at: {DAYS[now.weekday()]} {now.hour} "
+                    f"skipping={now.minute * MIN_1 + now.second} "
+                )
 
             # Use the same scheduling logic as the original player
-            outcome = player.play_slot(
-                channel_conf["network_name"], datetime.datetime.now()
+            outcome = await player.play_slot(
+                net_name, now
             )
 
-        logger.debug(f"Got player outcome:{outcome.status}")
+        logger.debug("Got player outcome:%s", outcome.status)
 
         # reset skip
         skip_play = False
         
-        # Check if web interface requested a channel change
-        if web_player.current_channel_index != channel_index:
-            logger.info(f"Web interface requested channel change from {channel_index} to {web_player.current_channel_index}")
-            channel_index = web_player.current_channel_index
-            channel_conf = manager.stations[channel_index]
-            web_player.player = WebStationPlayer(manager.stations[channel_index])
-            player = web_player.player
-            transition_fn(player, reception)
-            continue
-
         if outcome.status == PlayStatus.CHANNEL_CHANGE:
             stuck_timer = 0
-            tune_up = True
+            backoff = failed_backoff_min
+            # up unless the payload says otherwise, a direct tune moves to its channel and then stays put
+            delta = 1
             # get the json payload
             if outcome.payload:
                 try:
-                    as_obj = json.loads(outcome.payload)
+                    as_obj = orjson.loads(outcome.payload)
                     if "command" in as_obj:
                         if as_obj["command"] == "direct":
-                            tune_up = False
+                            delta = 0
                             if "channel" in as_obj:
                                 logger.debug(
-                                    f"Got direct tune command for channel {as_obj['channel']}"
+                                    "Got direct tune command for channel %s", as_obj["channel"]
                                 )
                                 new_index = manager.index_from_channel(
                                     as_obj["channel"]
                                 )
                                 if new_index is None:
                                     logger.warning(
-                                        f"Got direct tune command but could not find station with channel {as_obj['channel']}"
+                                        "Got direct tune command but could not find station with channel %s",
+                                        as_obj["channel"],
                                     )
                                 else:
                                     channel_index = new_index
@@ -899,59 +1488,56 @@ def main_loop(transition_fn, host="0.0.0.0", port=9191):
                                     "Got direct tune command, but no channel specified"
                                 )
                         elif as_obj["command"] == "up":
-                            tune_up = True
+                            delta = 1
                             logger.debug("Got channel up command")
                         elif as_obj["command"] == "down":
-                            tune_up = False
+                            delta = -1
                             logger.debug("Got channel down command")
-                            channel_index -= 1
-                            if channel_index < 0:
-                                channel_index = len(manager.stations) - 1
 
-                except Exception as e:
-                    logger.exception(e)
+                # orjson's decode error is a ValueError, TypeError covers valid json that isn't an object
+                except (ValueError, TypeError) as e:
                     logger.warning(
-                        "Got payload on channel change, but JSON convert failed"
+                        "Got payload on channel change, but JSON convert failed: %s", e
                     )
 
-            if tune_up:
+            if delta:
                 logger.info("Starting channel change")
-                channel_index += 1
-                if channel_index >= len(manager.stations):
-                    channel_index = 0
+                channel_index = (channel_index + delta) % n_stations
 
-            channel_conf = manager.stations[channel_index]
-            player.station_config = channel_conf
+            channel_conf = stations[channel_index]
+            net_type = channel_conf["network_type"]
+            net_name = channel_conf["network_name"]
+            chan_num = channel_conf["channel_number"]
+            standby = channel_conf.get("standby_image")
 
             # Update web player
-            web_player.current_channel_index = channel_index
-            web_player.player = WebStationPlayer(manager.stations[channel_index])
-            player = web_player.player  # Update the player reference
+            player = await web_player.switch_channel(channel_index)
 
             # long_change_effect(player, reception)
-            transition_fn(player, reception)
+            await transition_fn(player, reception)
 
         elif outcome.status == PlayStatus.FAILED:
             stuck_timer += 1
 
             # only put it up once after 2 seconds of being stuck
-            if stuck_timer >= 2 and "standby_image" in channel_conf:
-                player.play_file(channel_conf["standby_image"])
+            if stuck_timer >= 2 and standby:
+                await asyncio.to_thread(player.play_file, standby)
             current_title_on_stuck = player.get_current_title()
-            update_status_socket(
+            player.post_status(
                 "stuck",
-                channel_conf["network_name"],
-                channel_conf["channel_number"],
+                net_name,
+                chan_num,
                 current_title_on_stuck,
             )
 
-            time.sleep(1)
             logger.critical(
-                "Player failed to start - resting for 1 second and trying again"
+                "Player failed to start - resting for %.1f seconds and trying again", backoff
             )
 
-            # check for channel change so it doesn't stay stuck on a broken channel
-            new_outcome = check_channel_socket()
+            # rest, but wake for a channel change so it doesn't stay stuck on a broken channel
+            new_outcome = await player.wait_for_channel_change(backoff)
+            # a channel that keeps failing is retried less and less often
+            backoff = min(backoff * 1.5, failed_backoff_max)
             if new_outcome is not None:
                 outcome = new_outcome
                 # set skip play so outcome isn't overwritten
@@ -959,44 +1545,28 @@ def main_loop(transition_fn, host="0.0.0.0", port=9191):
                 skip_play = True
         elif outcome.status == PlayStatus.SUCCESS:
             stuck_timer = 0
+            backoff = failed_backoff_min
         else:
             stuck_timer = 0
 
 
-def none_change_effect(player, reception):
+async def none_change_effect(player, reception):
     pass
 
 
-def short_change_effect(player, reception):
-    prev = reception.improve_amount
-    reception.improve_amount = 0
-
+async def short_change_effect(player, reception):
+    # there's no filter graph to animate on the web, so drop reception in one go and let the page draw the static
     while not reception.is_degraded():
         reception.degrade(0.2)
-        player.update_filters()
-        time.sleep(debounce_fragment)
-
-    reception.improve_amount = prev
+    player.update_filters()
+    player.show_transition(short_static_ms)
 
 
-def long_change_effect(player, reception):
-    # add noise to current channel
+async def long_change_effect(player, reception):
     while not reception.is_degraded():
         reception.degrade()
-        player.update_filters()
-        time.sleep(debounce_fragment)
-
-    # reception.improve(1)
-    player.play_file("runtime/static.mp4")
-    while not reception.is_perfect():
-        reception.improve()
-        player.update_filters()
-        time.sleep(debounce_fragment)
-    # time.sleep(1)
-    while not reception.is_degraded():
-        reception.degrade()
-        player.update_filters()
-        time.sleep(debounce_fragment)
+    player.update_filters()
+    player.show_transition(long_static_ms)
 
 
 if __name__ == "__main__":